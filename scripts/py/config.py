@@ -3,9 +3,10 @@ from __future__ import annotations
 import json
 import os
 import re
-from copy import deepcopy
+import sys
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 try:
     import tomllib as _toml  # Python 3.11+
@@ -15,190 +16,42 @@ except ModuleNotFoundError:  # pragma: no cover
     except ModuleNotFoundError:  # pragma: no cover
         _toml = None
 
-_INT_RE = re.compile(r"^[+-]?\d+$")
-
-
-class _TomlDecodeError(ValueError):
-    pass
-
-
-def _strip_toml_comment(line: str) -> str:
-    in_single = False
-    in_double = False
-    escaped = False
-
-    for idx, ch in enumerate(line):
-        if in_double:
-            if escaped:
-                escaped = False
-            elif ch == "\\":
-                escaped = True
-            elif ch == '"':
-                in_double = False
-            continue
-
-        if in_single:
-            if ch == "'":
-                in_single = False
-            continue
-
-        if ch == "#":
-            return line[:idx]
-        if ch == '"':
-            in_double = True
-        elif ch == "'":
-            in_single = True
-
-    return line
-
-
-def _split_toml_list_items(raw: str) -> list[str]:
-    items: list[str] = []
-    token: list[str] = []
-    in_single = False
-    in_double = False
-    escaped = False
-    depth = 0
-
-    for ch in raw:
-        if in_double:
-            token.append(ch)
-            if escaped:
-                escaped = False
-            elif ch == "\\":
-                escaped = True
-            elif ch == '"':
-                in_double = False
-            continue
-
-        if in_single:
-            token.append(ch)
-            if ch == "'":
-                in_single = False
-            continue
-
-        if ch == '"':
-            in_double = True
-            token.append(ch)
-            continue
-
-        if ch == "'":
-            in_single = True
-            token.append(ch)
-            continue
-
-        if ch == "[":
-            depth += 1
-            token.append(ch)
-            continue
-
-        if ch == "]":
-            depth = max(0, depth - 1)
-            token.append(ch)
-            continue
-
-        if ch == "," and depth == 0:
-            items.append("".join(token).strip())
-            token = []
-            continue
-
-        token.append(ch)
-
-    tail = "".join(token).strip()
-    if tail:
-        items.append(tail)
-    return items
-
-
-def _parse_toml_value(raw: str) -> Any:
-    value = raw.strip()
-    if not value:
-        raise _TomlDecodeError("empty TOML value")
-
-    if value.startswith('"') and value.endswith('"'):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError as exc:
-            raise _TomlDecodeError(str(exc)) from exc
-
-    if value.startswith("'") and value.endswith("'"):
-        return value[1:-1]
-
-    lowered = value.lower()
-    if lowered == "true":
-        return True
-    if lowered == "false":
-        return False
-
-    if _INT_RE.match(value):
-        return int(value)
-
-    if value.startswith("[") and value.endswith("]"):
-        inner = value[1:-1].strip()
-        if not inner:
-            return []
-        return [_parse_toml_value(part) for part in _split_toml_list_items(inner)]
-
-    raise _TomlDecodeError(f"unsupported TOML value: {value}")
-
-
-def _loads_toml_fallback(text: str) -> dict[str, Any]:
-    root: dict[str, Any] = {}
-    current: dict[str, Any] = root
-
-    for lineno, raw_line in enumerate(text.splitlines(), start=1):
-        line = _strip_toml_comment(raw_line).strip()
-        if not line:
-            continue
-
-        if line.startswith("[") and line.endswith("]"):
-            section_name = line[1:-1].strip()
-            if not section_name:
-                raise _TomlDecodeError(f"line {lineno}: empty section header")
-
-            current = root
-            for part in section_name.split("."):
-                key = part.strip()
-                if not key:
-                    raise _TomlDecodeError(f"line {lineno}: invalid section header")
-                node = current.get(key)
-                if node is None:
-                    node = {}
-                    current[key] = node
-                if not isinstance(node, dict):
-                    raise _TomlDecodeError(
-                        f"line {lineno}: section collides with non-table key '{key}'"
-                    )
-                current = node
-            continue
-
-        if "=" not in line:
-            raise _TomlDecodeError(f"line {lineno}: expected key=value")
-
-        key_part, value_part = line.split("=", 1)
-        key = key_part.strip()
-        if not key:
-            raise _TomlDecodeError(f"line {lineno}: missing key before '='")
-
-        current[key] = _parse_toml_value(value_part)
-
-    return root
-
-
 if _toml is not None:  # pragma: no cover - depends on runtime
     _TOML_DECODE_ERROR = getattr(_toml, "TOMLDecodeError", ValueError)
 
     def _loads_toml(text: str) -> dict[str, Any]:
         return _toml.loads(text)
 
-else:
-    _TOML_DECODE_ERROR = _TomlDecodeError
+else:  # pragma: no cover - depends on runtime
+    import toml_fallback as _toml_fallback
 
-    def _loads_toml(text: str) -> dict[str, Any]:
-        return _loads_toml_fallback(text)
+    _TOML_DECODE_ERROR = _toml_fallback.TomlDecodeError
+    _loads_toml = _toml_fallback.loads
+
+try:
+    import orjson as _orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    _orjson = None
 
 
-DEFAULT_CONFIG: dict[str, Any] = {
+def _loads_json(data: bytes) -> Any:
+    if _orjson is not None:  # pragma: no cover - depends on runtime
+        return _orjson.loads(data)
+    return json.loads(data)
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Read-only and shared: tables are mapping proxies, lists are tuples and
+# strings are interned. _clone() thaws it into plain dicts and lists.
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze({
     "repo": {
         "base_branch": "main",
         "todo_file": "TODO.md",
@@ -227,44 +80,39 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "gate_regex": r"`(G[0-9]+ \\([^)]+\\))`",
         "done_keywords": ["DONE", "완료", "Complete", "complete"],
     },
-}
+})
 
 
 class ConfigError(RuntimeError):
     pass
 
 
-def _bootstrap_config_if_missing(cfg_path: Path) -> None:
-    if cfg_path.exists():
-        return
-
-    cfg_path.parent.mkdir(parents=True, exist_ok=True)
-
-    inferred_repo_name = cfg_path.parent.parent.name if cfg_path.parent.name == ".state" else cfg_path.parent.name
-    default_worktree_parent = str(DEFAULT_CONFIG["repo"]["worktree_parent"]).replace("<repo>", inferred_repo_name)
+def _toml_str(value: str) -> str:
+    # JSON string escaping is TOML-basic-string compatible. Escape '%' so the
+    # value survives the %-substitution of the bootstrap template.
+    return json.dumps(value, ensure_ascii=False).replace("%", "%%")
 
-    def q(value: str) -> str:
-        # JSON string escaping is TOML-basic-string compatible.
-        return json.dumps(value, ensure_ascii=False)
 
-    template = f"""[repo]
-base_branch = {q(str(DEFAULT_CONFIG["repo"]["base_branch"]))}
-todo_file = {q(str(DEFAULT_CONFIG["repo"]["todo_file"]))}
-state_dir = {q(str(DEFAULT_CONFIG["repo"]["state_dir"]))}
-worktree_parent = {q(default_worktree_parent)}
+# Everything except worktree_parent (which embeds the repo name) is static,
+# so the bootstrap file body is rendered once at import time.
+_BOOTSTRAP_TEMPLATE = f"""[repo]
+base_branch = {_toml_str(str(DEFAULT_CONFIG["repo"]["base_branch"]))}
+todo_file = {_toml_str(str(DEFAULT_CONFIG["repo"]["todo_file"]))}
+state_dir = {_toml_str(str(DEFAULT_CONFIG["repo"]["state_dir"]))}
+worktree_parent = %(worktree_parent)s
 
 [owners]
-AgentA = {q(str(DEFAULT_CONFIG["owners"]["AgentA"]))}
-AgentB = {q(str(DEFAULT_CONFIG["owners"]["AgentB"]))}
-AgentC = {q(str(DEFAULT_CONFIG["owners"]["AgentC"]))}
-AgentD = {q(str(DEFAULT_CONFIG["owners"]["AgentD"]))}
-AgentE = {q(str(DEFAULT_CONFIG["owners"]["AgentE"]))}
+AgentA = {_toml_str(str(DEFAULT_CONFIG["owners"]["AgentA"]))}
+AgentB = {_toml_str(str(DEFAULT_CONFIG["owners"]["AgentB"]))}
+AgentC = {_toml_str(str(DEFAULT_CONFIG["owners"]["AgentC"]))}
+AgentD = {_toml_str(str(DEFAULT_CONFIG["owners"]["AgentD"]))}
+AgentE = {_toml_str(str(DEFAULT_CONFIG["owners"]["AgentE"]))}
 
 [runtime]
 max_start = {int(DEFAULT_CONFIG["runtime"]["max_start"])}
-launch_backend = {q(str(DEFAULT_CONFIG["runtime"]["launch_backend"]))}
+launch_backend = {_toml_str(str(DEFAULT_CONFIG["runtime"]["launch_backend"]))}
 auto_no_launch = {str(bool(DEFAULT_CONFIG["runtime"]["auto_no_launch"])).lower()}
-codex_flags = {q(str(DEFAULT_CONFIG["runtime"]["codex_flags"]))}
+codex_flags = {_toml_str(str(DEFAULT_CONFIG["runtime"]["codex_flags"]))}
 
 [todo]
 id_col = {int(DEFAULT_CONFIG["todo"]["id_col"])}
@@ -272,23 +120,72 @@ title_col = {int(DEFAULT_CONFIG["todo"]["title_col"])}
 owner_col = {int(DEFAULT_CONFIG["todo"]["owner_col"])}
 deps_col = {int(DEFAULT_CONFIG["todo"]["deps_col"])}
 status_col = {int(DEFAULT_CONFIG["todo"]["status_col"])}
-gate_regex = {q(str(DEFAULT_CONFIG["todo"]["gate_regex"]))}
+gate_regex = {_toml_str(str(DEFAULT_CONFIG["todo"]["gate_regex"]))}
 done_keywords = ["DONE", "완료", "Complete", "complete"]
 """
-    cfg_path.write_text(template, encoding="utf-8")
 
 
-def owner_key(owner: str) -> str:
-    return "".join(ch.lower() for ch in owner if ch.isalnum())
+def _bootstrap_config_if_missing(cfg_path: Path) -> None:
+    cfg_path.parent.mkdir(parents=True, exist_ok=True)
+
+    inferred_repo_name = cfg_path.parent.parent.name if cfg_path.parent.name == ".state" else cfg_path.parent.name
+    default_worktree_parent = str(DEFAULT_CONFIG["repo"]["worktree_parent"]).replace("<repo>", inferred_repo_name)
+
+    body = _BOOTSTRAP_TEMPLATE % {"worktree_parent": json.dumps(default_worktree_parent, ensure_ascii=False)}
+    # Exclusive create instead of an exists() check: a concurrent bootstrap
+    # that won the race keeps its file.
+    try:
+        with cfg_path.open("xb") as fh:
+            fh.write(body.encode("utf-8"))
+    except FileExistsError:
+        return
+
 
+# Unicode-aware: [^\W_] is exactly the set of characters str.isalnum() accepts.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
 
-def _deep_merge(base: dict[str, Any], incoming: dict[str, Any]) -> dict[str, Any]:
-    merged = deepcopy(base)
-    for key, value in incoming.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = _deep_merge(merged[key], value)
-        else:
-            merged[key] = value
+
+def owner_key(owner: str) -> str:
+    return _NON_ALNUM_RE.sub("", owner).lower()
+
+
+# Default owners are merged into every config, so their keys are computed once.
+_DEFAULT_OWNER_KEYS = {name: owner_key(name) for name in DEFAULT_CONFIG["owners"]}
+
+
+def _clone(value: Any) -> Any:
+    # Config trees only hold tables, arrays and immutable scalars, so a plain
+    # per-level copy is enough and much cheaper than copy.deepcopy. Frozen
+    # defaults (mapping proxies, tuples) come back as mutable dicts/lists.
+    value_type = type(value)
+    if value_type is dict or value_type is MappingProxyType:
+        return {k: _clone(v) for k, v in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_clone(v) for v in value]
+    return value
+
+
+def _deep_merge(base: Mapping[str, Any], incoming: dict[str, Any]) -> dict[str, Any]:
+    # Build the result in a single iterative walk: base keys keep their order,
+    # keys only present in `incoming` follow, and untouched defaults are cloned.
+    merged: dict[str, Any] = {}
+    stack = [(merged, base, incoming)]
+    while stack:
+        dst, base_level, incoming_level = stack.pop()
+        for key, base_value in base_level.items():
+            if key not in incoming_level:
+                dst[key] = _clone(base_value)
+                continue
+            value = incoming_level[key]
+            if isinstance(base_value, (dict, MappingProxyType)) and isinstance(value, dict):
+                child: dict[str, Any] = {}
+                dst[key] = child
+                stack.append((child, base_value, value))
+            else:
+                dst[key] = value
+        for key, value in incoming_level.items():
+            if key not in base_level:
+                dst[key] = value
     return merged
 
 
@@ -311,17 +208,55 @@ def _repo_root_from_config_path(cfg_path: Path, fallback_repo_root: Path) -> Pat
     return fallback_repo_root
 
 
-def load_config(repo_root: Path, config_path: str | None = None) -> tuple[dict[str, Any], Path]:
-    cfg_path = Path(config_path).expanduser() if config_path else (repo_root / ".state" / "orchestrator.toml")
+_LAUNCH_BACKENDS = frozenset(("auto", "tmux", "codex_exec"))
+_COL_KEYS = ("id_col", "title_col", "owner_col", "deps_col", "status_col")
+
+# (cfg_path, repo_root) -> (st_mtime_ns, st_size, frozen merged config)
+_CONFIG_CACHE: dict[tuple[Path, Path], tuple[int, int, Mapping[str, Any]]] = {}
+
+
+def clear_config_cache() -> None:
+    _CONFIG_CACHE.clear()
+
+
+def load_config(repo_root: Path, config_path: str | None = None) -> tuple[Mapping[str, Any], Path]:
+    # The returned config is shared between calls while the file is unchanged,
+    # so it is frozen like DEFAULT_CONFIG.
+    if config_path:
+        cfg_path = Path(config_path).expanduser()
+    else:
+        # orchestrator.json, when present, takes precedence over the TOML file.
+        cfg_path = repo_root / ".state" / "orchestrator.json"
+        if not cfg_path.is_file():
+            cfg_path = repo_root / ".state" / "orchestrator.toml"
     if not cfg_path.is_absolute():
         cfg_path = (repo_root / cfg_path).resolve()
-
-    _bootstrap_config_if_missing(cfg_path)
+    is_json = cfg_path.suffix.lower() == ".json"
 
     try:
-        parsed = _loads_toml(cfg_path.read_text(encoding="utf-8"))
-    except _TOML_DECODE_ERROR as exc:
-        raise ConfigError(f"invalid TOML in {cfg_path}: {exc}") from exc
+        st = os.stat(cfg_path)
+    except FileNotFoundError:
+        if is_json:
+            raise ConfigError(f"config file not found: {cfg_path}") from None
+        _bootstrap_config_if_missing(cfg_path)
+        st = os.stat(cfg_path)
+
+    cache_key = (cfg_path, repo_root)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cfg_path
+
+    data = cfg_path.read_bytes()
+    if is_json:
+        try:
+            parsed = _loads_json(data)
+        except ValueError as exc:
+            raise ConfigError(f"invalid JSON in {cfg_path}: {exc}") from exc
+    else:
+        try:
+            parsed = _loads_toml(data.decode("utf-8"))
+        except _TOML_DECODE_ERROR as exc:
+            raise ConfigError(f"invalid TOML in {cfg_path}: {exc}") from exc
 
     if not isinstance(parsed, dict):
         raise ConfigError(f"invalid config root (expected table): {cfg_path}")
@@ -333,39 +268,48 @@ def load_config(repo_root: Path, config_path: str | None = None) -> tuple[dict[s
         raise ConfigError("[owners] must be a non-empty table")
 
     todo = merged.get("todo", {})
-    for key in ("id_col", "title_col", "owner_col", "deps_col", "status_col"):
-        value = todo.get(key)
-        if not isinstance(value, int) or value < 1:
-            raise ConfigError(f"todo.{key} must be an integer >= 1")
+    cols = [todo.get(key) for key in _COL_KEYS]
+    if not all(isinstance(value, int) and value >= 1 for value in cols):
+        for key, value in zip(_COL_KEYS, cols):
+            if not isinstance(value, int) or value < 1:
+                raise ConfigError(f"todo.{key} must be an integer >= 1")
 
     if not isinstance(todo.get("done_keywords"), list) or not todo["done_keywords"]:
         raise ConfigError("todo.done_keywords must be a non-empty list")
 
-    launch_backend = str(merged.get("runtime", {}).get("launch_backend", "")).strip().lower()
-    if launch_backend not in {"auto", "tmux", "codex_exec"}:
-        raise ConfigError(
-            "runtime.launch_backend must be one of: auto, tmux, codex_exec"
-        )
-    merged["runtime"]["launch_backend"] = launch_backend
+    runtime = merged["runtime"]
+    launch_backend = runtime.get("launch_backend", "")
+    if not isinstance(launch_backend, str) or launch_backend not in _LAUNCH_BACKENDS:
+        launch_backend = str(launch_backend).strip().lower()
+        if launch_backend not in _LAUNCH_BACKENDS:
+            raise ConfigError(
+                "runtime.launch_backend must be one of: auto, tmux, codex_exec"
+            )
+        runtime["launch_backend"] = launch_backend
 
     config_repo_root = _repo_root_from_config_path(cfg_path, repo_root)
     merged["repo"]["worktree_parent"] = _expand_repo_placeholder(
         str(merged["repo"]["worktree_parent"]), config_repo_root.name
     )
 
-    return merged, cfg_path
+    frozen = _freeze(merged)
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, frozen)
+    return frozen, cfg_path
 
 
 def resolve_context(
     repo_root: Path,
-    config: dict[str, Any],
+    config: Mapping[str, Any],
     state_dir_arg: str | None = None,
     config_path: Path | None = None,
 ) -> dict[str, Any]:
     repo_name = repo_root.name
     repo_parent = repo_root.parent
 
-    config_repo_root = _repo_root_from_config_path(config_path, repo_root) if config_path else repo_root
+    if config_path:
+        config_repo_root = _repo_root_from_config_path(config_path, repo_root)
+    else:
+        config_repo_root = repo_root
 
     todo_file = _to_abs(config_repo_root, str(config["repo"]["todo_file"]))
     worktree_parent = _to_abs(config_repo_root, str(config["repo"]["worktree_parent"]))
@@ -385,8 +329,14 @@ def resolve_context(
         "codex_flags": str(config["runtime"]["codex_flags"]),
     }
 
-    owners_raw = {str(k): str(v) for k, v in config["owners"].items()}
-    owners_by_key = {owner_key(k): v for k, v in owners_raw.items()}
+    owners_raw: dict[str, str] = {}
+    owners_by_key: dict[str, str] = {}
+    key_of = owner_key
+    default_keys = _DEFAULT_OWNER_KEYS
+    for k, v in config["owners"].items():
+        sk, sv = str(k), str(v)
+        owners_raw[sk] = sv
+        owners_by_key[default_keys.get(sk) or key_of(sk)] = sv
 
     return {
         "repo_root": str(repo_root),
@@ -400,7 +350,8 @@ def resolve_context(
         "updates_file": str(updates_file),
         "worktree_parent": str(worktree_parent),
         "runtime": runtime,
-        "todo": config["todo"],
+        # ctx is per call and JSON-serialized; thaw the shared schema.
+        "todo": _clone(config["todo"]),
         "owners": owners_raw,
         "owners_by_key": owners_by_key,
     }
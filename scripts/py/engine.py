@@ -3,14 +3,28 @@ from __future__ import annotations
 
 import argparse
 import json
-import shlex
+import os
 import subprocess
 import sys
-from datetime import datetime
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ModuleNotFoundError:  # pragma: no cover - optional output format
+    msgpack = None
 
 _SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+_CODEX_TASKS_BIN = str(_SCRIPTS_DIR / "codex-tasks")
 
 
 def _read_version() -> str:
@@ -21,16 +35,82 @@ def _read_version() -> str:
         return "dev"
 
 from config import ConfigError, load_config, owner_key, resolve_context
-from session_parser import SessionBlock, SessionView, parse_session_structured, read_tail_text
 from state_model import (
     classify_records,
     is_active_state,
+    is_pid_alive,
+    iter_classified_records,
     load_lock_inventory,
     load_pid_inventory,
     summarize,
 )
 from task_spec import evaluate_task_spec, task_spec_rel_path
-from todo_parser import TodoError, build_indexes, deps_ready, parse_todo
+from todo_parser import TodoError, parse_todo, pending_dep_counts
+
+
+def _orjson_bytes(obj: Any, indent: bool, sort_keys: bool) -> bytes | None:
+    if orjson is None:
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        # e.g. surrogate-escaped (non-UTF-8) file names, which json accepts.
+        return None
+
+
+def _stdlib_json(obj: Any, indent: bool, sort_keys: bool) -> str:
+    # Same text orjson produces: 2-space indent, or no whitespace at all.
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+
+
+def _json_bytes(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    data = _orjson_bytes(obj, indent, sort_keys)
+    if data is not None:
+        return data
+    return _stdlib_json(obj, indent, sort_keys).encode("utf-8", "surrogateescape")
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    # For embedding JSON in text (env exports); command output uses _write_json.
+    data = _orjson_bytes(obj, indent, False)
+    if data is not None:
+        return data.decode("utf-8")
+    return _stdlib_json(obj, indent, False)
+
+
+def _write_msgpack(obj: Any) -> None:
+    if msgpack is None:
+        die("--format msgpack requires the msgpack package (python3 -m pip install msgpack)")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(msgpack.packb(obj, use_bin_type=True))
+
+
+def _write_ndjson(rows: list[Any]) -> None:
+    # One compact JSON document per line; consumers can parse row by row.
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    for row in rows:
+        out.write(_json_bytes(row))
+        out.write(b"\n")
+
+
+def _write_json(obj: Any) -> None:
+    # Large payloads go straight to the byte stream, skipping the text layer.
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(_json_bytes(obj, indent=True))
+    out.write(b"\n")
+
+
+# Owner names repeat across tasks, workers and refreshes; normalize each once.
+_owner_key = lru_cache(maxsize=1024)(owner_key)
 
 
 def die(msg: str, code: int = 1) -> None:
@@ -38,7 +118,7 @@ def die(msg: str, code: int = 1) -> None:
     raise SystemExit(code)
 
 
-def resolve_repo_root(repo_arg: str | None) -> Path:
+def _git_toplevel(repo_arg: str | None) -> Path:
     cmd = ["git"]
     if repo_arg:
         cmd.extend(["-C", repo_arg])
@@ -53,7 +133,47 @@ def resolve_repo_root(repo_arg: str | None) -> Path:
     return Path(proc.stdout.strip()).resolve()
 
 
-def load_ctx(args: argparse.Namespace) -> tuple[dict[str, Any], dict[str, Any], Path]:
+@lru_cache(maxsize=None)
+def resolve_repo_root(repo_arg: str | None) -> Path:
+    # Walk up to the nearest .git (a directory, or a file for linked
+    # worktrees and submodules) instead of forking git. GIT_DIR/GIT_WORK_TREE
+    # overrides, or CODEX_TASKS_GIT_FALLBACK=1, defer to git itself.
+    if os.getenv("CODEX_TASKS_GIT_FALLBACK") == "1" or os.getenv("GIT_DIR") or os.getenv("GIT_WORK_TREE"):
+        return _git_toplevel(repo_arg)
+
+    start = Path(repo_arg).resolve() if repo_arg else Path.cwd().resolve()
+    if start.is_dir():
+        for candidate in (start, *start.parents):
+            if os.path.exists(candidate / ".git"):
+                return candidate
+    # Nothing found (or an odd layout): let git decide and produce the error.
+    return _git_toplevel(repo_arg)
+
+
+@dataclass(slots=True)
+class ReadyArgs:
+    repo: str | None
+    state_dir: str | None
+    config: str | None
+    trigger: str | None
+    max_start: int | None
+
+
+def _ready_args(args: Any) -> ReadyArgs:
+    # Snapshot the options the payload builders read, once per command (or
+    # once per TUI session) instead of on every refresh.
+    if isinstance(args, ReadyArgs):
+        return args
+    return ReadyArgs(
+        getattr(args, "repo", None),
+        getattr(args, "state_dir", None),
+        getattr(args, "config", None),
+        getattr(args, "trigger", None),
+        getattr(args, "max_start", None),
+    )
+
+
+def load_ctx(args: argparse.Namespace | ReadyArgs) -> tuple[Mapping[str, Any], dict[str, Any], Path]:
     repo_root = resolve_repo_root(args.repo)
     config, config_path = load_config(repo_root, args.config)
     ctx = resolve_context(
@@ -63,6 +183,8 @@ def load_ctx(args: argparse.Namespace) -> tuple[dict[str, Any], dict[str, Any],
 
 
 def to_env(ctx: dict[str, Any]) -> str:
+    import shlex
+
     state_dir = ctx["state_dir"]
     plain = {
         "REPO_ROOT": ctx["repo_root"],
@@ -79,13 +201,40 @@ def to_env(ctx: dict[str, Any]) -> str:
         "AUTO_NO_LAUNCH": "1" if ctx["runtime"]["auto_no_launch"] else "0",
         "CODEX_FLAGS": ctx["runtime"]["codex_flags"],
         "CONFIG_PATH": ctx["config_path"],
-        "OWNERS_JSON": json.dumps(ctx["owners"], ensure_ascii=False),
-        "OWNERS_BY_KEY_JSON": json.dumps(ctx["owners_by_key"], ensure_ascii=False),
-        "TODO_SCHEMA_JSON": json.dumps(ctx["todo"], ensure_ascii=False),
+        "OWNERS_JSON": _json_dumps(ctx["owners"]),
+        "OWNERS_BY_KEY_JSON": _json_dumps(ctx["owners_by_key"]),
+        "TODO_SCHEMA_JSON": _json_dumps(ctx["todo"]),
     }
     return "\n".join(f"{k}={shlex.quote(v)}" for k, v in plain.items())
 
 
+# todo_file -> (st_mtime_ns, st_size) last seen not to be the legacy placeholder
+_TODO_CHECKED: dict[str, tuple[int, int]] = {}
+# todo_file -> (st_mtime_ns, st_size, schema, (tasks, gates))
+_TODO_CACHE: dict[str, tuple[int, int, dict[str, Any], tuple[list[dict[str, str]], dict[str, str]]]] = {}
+
+
+def _parse_todo_cached(todo_file: str, schema: dict[str, Any]) -> tuple[list[dict[str, str]], dict[str, str]]:
+    # The parsed board is shared between refreshes; callers must not mutate it.
+    try:
+        st = Path(todo_file).stat()
+    except OSError:
+        return parse_todo(todo_file, schema)
+
+    cached = _TODO_CACHE.get(todo_file)
+    if (
+        cached is not None
+        and cached[0] == st.st_mtime_ns
+        and cached[1] == st.st_size
+        and cached[2] == schema
+    ):
+        return cached[3]
+
+    parsed = parse_todo(todo_file, schema)
+    _TODO_CACHE[todo_file] = (st.st_mtime_ns, st.st_size, schema, parsed)
+    return parsed
+
+
 def ensure_todo_file(todo_path: str | Path) -> Path:
     path = Path(todo_path)
     canonical_template = """# TODO Board
@@ -99,13 +248,23 @@ def ensure_todo_file(todo_path: str | Path) -> Path:
 |---|---|---|---|---|---|---|
 """
 
-    if path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        # A file already checked and left untouched since is not the placeholder.
+        sig = (st.st_mtime_ns, st.st_size)
+        if _TODO_CHECKED.get(str(path)) == sig:
+            return path
         current = path.read_text(encoding="utf-8")
         # Backward compatibility: early dashboard bootstrap created an empty
         # 7-column placeholder that does not match the scheduler defaults.
         # Rewrite only when file is still the untouched empty placeholder.
         if current.strip() == legacy_empty_template.strip():
             path.write_text(canonical_template, encoding="utf-8")
+        else:
+            _TODO_CHECKED[str(path)] = sig
         return path
 
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -119,7 +278,7 @@ def cmd_paths(args: argparse.Namespace) -> None:
         print(to_env(ctx))
         return
 
-    print(json.dumps(ctx, ensure_ascii=False, indent=2))
+    _write_json(ctx)
 
 
 def _active_maps(records: list[dict[str, Any]]) -> tuple[dict[str, dict[str, str]], set[str], dict[str, str]]:
@@ -127,21 +286,35 @@ def _active_maps(records: list[dict[str, Any]]) -> tuple[dict[str, dict[str, str
     active_owner_keys: set[str] = set()
     conflict_by_task: dict[str, str] = {}
 
-    task_active_records: dict[str, list[dict[str, Any]]] = {}
+    # task_id -> [active row count, any lock file, any live pid]
+    task_signals: dict[str, list[Any]] = {}
+
+    # Classified records always carry str task_id/owner/state; skip str().
+    active = is_active_state
+    key_of = _owner_key
+    add_owner_key = active_owner_keys.add
+    signals_get = task_signals.get
 
     for row in records:
-        task_id = str(row.get("task_id") or "")
-        if not task_id or not is_active_state(str(row.get("state") or "")):
+        task_id = row.get("task_id") or ""
+        if not task_id or not active(row.get("state") or ""):
             continue
 
-        task_active_records.setdefault(task_id, []).append(row)
-
-        owner = str(row.get("owner") or "")
+        owner = row.get("owner") or ""
         if owner:
-            active_owner_keys.add(owner_key(owner))
+            add_owner_key(key_of(owner))
 
         has_alive_pid = bool(row.get("pid_alive"))
         has_lock = bool(row.get("lock_file"))
+
+        signals = signals_get(task_id)
+        if signals is None:
+            task_signals[task_id] = [1, has_lock, has_alive_pid]
+        else:
+            signals[0] += 1
+            signals[1] = signals[1] or has_lock
+            signals[2] = signals[2] or has_alive_pid
+
         if has_alive_pid:
             active_by_task[task_id] = {
                 "reason": "active_worker", "source": "pid"}
@@ -149,73 +322,205 @@ def _active_maps(records: list[dict[str, Any]]) -> tuple[dict[str, dict[str, str
             active_by_task[task_id] = {
                 "reason": "active_lock", "source": "lock"}
 
-    for task_id, rows in task_active_records.items():
-        if len(rows) <= 1:
-            continue
-
-        owner_keys = {owner_key(str(r.get("owner") or ""))
-                      for r in rows if str(r.get("owner") or "")}
-        has_lock = any(bool(r.get("lock_file")) for r in rows)
-        has_pid = any(bool(r.get("pid_alive")) for r in rows)
-        if has_lock and has_pid:
-            if len(owner_keys) > 1 or len(rows) > 1:
-                conflict_by_task[task_id] = "active_signal_conflict"
+    # Several active rows for one task that mix a lock and a live pid mean
+    # the signals disagree about who owns it.
+    for task_id, (count, has_lock, has_pid) in task_signals.items():
+        if count > 1 and has_lock and has_pid:
+            conflict_by_task[task_id] = "active_signal_conflict"
 
     return active_by_task, active_owner_keys, conflict_by_task
 
 
-def _ready_payload(args: argparse.Namespace) -> dict[str, Any]:
+# (repo_root, task_id) -> (st_mtime_ns, st_size, evaluate_task_spec result)
+_SPEC_CACHE: dict[tuple[str, str], tuple[int, int, dict[str, Any]]] = {}
+
+
+def _evaluate_task_spec_cached(repo_root: str, task_id: str) -> dict[str, Any]:
+    # Specs rarely change between refreshes; re-parse only when the file's
+    # stat signature moves. A missing spec is cached as (-1, -1).
+    try:
+        st = (Path(repo_root) / task_spec_rel_path(task_id)).stat()
+        sig = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        sig = (-1, -1)
+
+    key = (repo_root, task_id)
+    cached = _SPEC_CACHE.get(key)
+    if cached is not None and cached[0] == sig[0] and cached[1] == sig[1]:
+        return cached[2]
+
+    spec = evaluate_task_spec(repo_root, task_id)
+    _SPEC_CACHE[key] = (sig[0], sig[1], spec)
+    return spec
+
+
+# Last (tasks, gates, pending counts); _parse_todo_cached returns the same list
+# and dict objects while TODO.md is unchanged, so identity is the cache key.
+_DEP_GRAPH_CACHE: list[tuple[Any, Any, list[int]]] = []
+
+
+def _pending_dep_counts_cached(tasks: list[dict[str, str]], gates: dict[str, str]) -> list[int]:
+    if _DEP_GRAPH_CACHE:
+        cached_tasks, cached_gates, pending = _DEP_GRAPH_CACHE[0]
+        if cached_tasks is tasks and cached_gates is gates:
+            return pending
+    pending = pending_dep_counts(tasks, gates)
+    _DEP_GRAPH_CACHE[:] = [(tasks, gates, pending)]
+    return pending
+
+
+# (loader name, dir) -> (signature, rows); at most _DIR_CACHE_MAX entries,
+# oldest evicted first.
+_DIR_CACHE: dict[tuple[str, str], tuple[tuple[Any, ...], list[dict[str, Any]]]] = {}
+_DIR_CACHE_MAX = 8
+
+
+def _dir_signature(path: str) -> tuple[Any, ...] | None:
+    # The directory mtime only moves on create/delete; task_ops.sh rewrites
+    # lock and pid files in place, so fold in each entry's stat as well.
+    try:
+        dir_mtime = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            entries = []
+            for entry in it:
+                # Only *.pid / *.lock feed the loaders; logs next to them churn.
+                if not entry.name.endswith((".pid", ".lock")):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    entries.sort()
+    return (dir_mtime, tuple(entries))
+
+
+def _cached_dir_load(loader: Any, path: str) -> list[dict[str, Any]]:
+    # Callers only read the returned rows; they are shared across hits.
+    sig = _dir_signature(path)
+    if sig is None:
+        return loader(path)
+    key = (loader.__name__, path)
+    cached = _DIR_CACHE.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    rows = loader(path)
+    _DIR_CACHE.pop(key, None)
+    if len(_DIR_CACHE) >= _DIR_CACHE_MAX:
+        del _DIR_CACHE[next(iter(_DIR_CACHE))]
+    _DIR_CACHE[key] = (sig, rows)
+    return rows
+
+
+def _ready_payload(args: ReadyArgs) -> dict[str, Any]:
     _, ctx, _ = load_ctx(args)
+    return _ready_payload_from_ctx(ctx, args)
+
+
+def _load_sources(
+    ctx: dict[str, Any], parallel: bool = False
+) -> tuple[list[dict[str, str]], dict[str, str], list[dict[str, Any]], list[dict[str, Any]]]:
+    if not parallel:
+        # One-shot commands: the reads are small, thread startup would dominate.
+        tasks, gates = _parse_todo_cached(ctx["todo_file"], ctx["todo"])
+        return (
+            tasks,
+            gates,
+            _cached_dir_load(load_lock_inventory, ctx["lock_dir"]),
+            _cached_dir_load(load_pid_inventory, ctx["orch_dir"]),
+        )
+
+    # concurrent.futures pulls in logging; only the status path pays for it.
+    from concurrent.futures import ThreadPoolExecutor
 
+    # TODO parsing and the lock/pid directory scans are independent reads.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        todo_future = pool.submit(_parse_todo_cached, ctx["todo_file"], ctx["todo"])
+        lock_future = pool.submit(_cached_dir_load, load_lock_inventory, ctx["lock_dir"])
+        pid_future = pool.submit(_cached_dir_load, load_pid_inventory, ctx["orch_dir"])
+        tasks, gates = todo_future.result()
+        return tasks, gates, lock_future.result(), pid_future.result()
+
+
+@dataclass
+class State:
+    ctx: dict[str, Any]
+    tasks: list[dict[str, str]]
+    gates: dict[str, str]
+    lock_rows: list[dict[str, Any]]
+    pid_rows: list[dict[str, Any]]
+    records: list[dict[str, Any]]
+
+
+def _collect_state(ctx: dict[str, Any], parallel: bool = False) -> State:
+    # Parse TODO.md, scan locks/pids and classify workers once for every
+    # section that needs them.
     ensure_todo_file(ctx["todo_file"])
-    tasks, gates = parse_todo(ctx["todo_file"], ctx["todo"])
-    task_status = build_indexes(tasks)
+    tasks, gates, lock_rows, pid_rows = _load_sources(ctx, parallel)
+    return State(ctx, tasks, gates, lock_rows, pid_rows, classify_records(pid_rows, lock_rows))
+
 
-    lock_rows = load_lock_inventory(ctx["lock_dir"])
-    pid_rows = load_pid_inventory(ctx["orch_dir"])
-    records = classify_records(pid_rows, lock_rows)
+def _ready_payload_from_ctx(ctx: dict[str, Any], args: ReadyArgs) -> dict[str, Any]:
+    return _ready_payload_from_state(_collect_state(ctx), args)
 
+
+def _ready_payload_from_state(state: State, args: ReadyArgs) -> dict[str, Any]:
+    ctx = state.ctx
+    tasks = state.tasks
+    gates = state.gates
+    lock_rows = state.lock_rows
+    records = state.records
     active_by_task, active_owner_keys, conflict_by_task = _active_maps(records)
 
-    running_locks: list[dict[str, str]] = []
-    for lock in lock_rows:
-        running_locks.append(
-            {
-                "task_id": lock.get("task_id", ""),
-                "owner": lock.get("owner", ""),
-                "scope": lock.get("scope", ""),
-            }
-        )
+    running_locks: list[dict[str, str]] = [
+        {
+            "task_id": lock.get("task_id", ""),
+            "owner": lock.get("owner", ""),
+            "scope": lock.get("scope", ""),
+        }
+        for lock in lock_rows
+    ]
 
     max_start = args.max_start if args.max_start is not None else int(
         ctx["runtime"]["max_start"])
 
     ready_tasks: list[dict[str, str]] = []
     excluded_tasks: list[dict[str, str]] = []
-    scheduled_owner_keys: set[str] = set()
-
-    for task in tasks:
-        if task["status"] != "TODO":
+    # Owners with a live worker plus owners scheduled earlier in this pass.
+    busy_owner_keys = set(active_owner_keys)
+    owners_by_key = ctx["owners_by_key"]
+    # Raw owner -> (owner key, mapped scope), resolved once per distinct owner.
+    owner_info: dict[str, tuple[str, str | None]] = {}
+    pending_deps = _pending_dep_counts_cached(tasks, gates)
+
+    for index, task in enumerate(tasks):
+        status = task["status"]
+        if status != "TODO":
             continue
 
         task_id = task["id"]
         owner = task["owner"]
-        task_owner_key = owner_key(owner)
-        scope = ctx["owners_by_key"].get(task_owner_key)
+        info = owner_info.get(owner)
+        if info is None:
+            task_owner_key = _owner_key(owner)
+            info = owner_info[owner] = (task_owner_key, owners_by_key.get(task_owner_key))
+        task_owner_key, scope = info
 
         if not scope:
             # unmapped owner is intentionally skipped from scheduling
             continue
 
+        title = task["title"]
+        deps = task["deps"]
+
         if task_id in conflict_by_task:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": "active_signal_conflict",
                     "source": "scheduler",
                 }
@@ -227,42 +532,42 @@ def _ready_payload(args: argparse.Namespace) -> dict[str, Any]:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": active_signal["reason"],
                     "source": active_signal["source"],
                 }
             )
             continue
 
-        if task_owner_key in active_owner_keys or task_owner_key in scheduled_owner_keys:
+        if task_owner_key in busy_owner_keys:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": "owner_busy",
                     "source": "scheduler",
                 }
             )
             continue
 
-        spec = evaluate_task_spec(ctx["repo_root"], task_id)
+        spec = _evaluate_task_spec_cached(ctx["repo_root"], task_id)
         if not spec["exists"]:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": "missing_task_spec",
                     "source": "scheduler",
                 }
@@ -272,26 +577,26 @@ def _ready_payload(args: argparse.Namespace) -> dict[str, Any]:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": "invalid_task_spec",
                     "source": "scheduler",
                 }
             )
             continue
 
-        if not deps_ready(task["deps"], task_status, gates):
+        if pending_deps[index]:
             excluded_tasks.append(
                 {
                     "task_id": task_id,
-                    "title": task["title"],
+                    "title": title,
                     "owner": owner,
                     "scope": scope,
-                    "deps": task["deps"],
-                    "status": task["status"],
+                    "deps": deps,
+                    "status": status,
                     "reason": "deps_not_ready",
                     "source": "scheduler",
                 }
@@ -301,19 +606,19 @@ def _ready_payload(args: argparse.Namespace) -> dict[str, Any]:
         ready_tasks.append(
             {
                 "task_id": task_id,
-                "title": task["title"],
+                "title": title,
                 "owner": owner,
                 "owner_key": task_owner_key,
                 "scope": scope,
-                "deps": task["deps"],
-                "status": task["status"],
+                "deps": deps,
+                "status": status,
                 "spec_rel_path": str(spec.get("spec_rel_path") or ""),
                 "goal_summary": str(spec.get("goal_summary") or ""),
                 "in_scope_summary": str(spec.get("in_scope_summary") or ""),
                 "acceptance_summary": str(spec.get("acceptance_summary") or ""),
             }
         )
-        scheduled_owner_keys.add(task_owner_key)
+        busy_owner_keys.add(task_owner_key)
 
         if max_start > 0 and len(ready_tasks) >= max_start:
             break
@@ -330,95 +635,174 @@ def _ready_payload(args: argparse.Namespace) -> dict[str, Any]:
 
 
 def cmd_ready(args: argparse.Namespace) -> None:
-    payload = _ready_payload(args)
+    payload = _ready_payload(_ready_args(args))
 
     if args.format == "tsv":
-        for task in payload["ready_tasks"]:
-            print(
-                "\t".join(
-                    [
-                        task["task_id"],
-                        task["title"],
-                        task["owner"],
-                        task["scope"],
-                        task["deps"],
-                        task["status"],
-                        str(task.get("spec_rel_path") or ""),
-                        str(task.get("goal_summary") or ""),
-                        str(task.get("in_scope_summary") or ""),
-                        str(task.get("acceptance_summary") or ""),
-                    ]
-                )
+        _emit_tsv(
+            (
+                task["task_id"],
+                task["title"],
+                task["owner"],
+                task["scope"],
+                task["deps"],
+                task["status"],
+                str(task.get("spec_rel_path") or ""),
+                str(task.get("goal_summary") or ""),
+                str(task.get("in_scope_summary") or ""),
+                str(task.get("acceptance_summary") or ""),
             )
+            for task in payload["ready_tasks"]
+        )
         return
 
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    _write_json(payload)
+
+
+def _build_inventory_payload(args: ReadyArgs) -> dict[str, Any]:
+    _, ctx, _ = load_ctx(args)
+    return _inventory_payload_from_ctx(ctx)
 
 
-def _inventory_payload(args: argparse.Namespace) -> dict[str, Any]:
-    _, ctx, repo_root = load_ctx(args)
+def _inventory_payload_from_ctx(ctx: dict[str, Any]) -> dict[str, Any]:
+    pid_rows = _cached_dir_load(load_pid_inventory, ctx["orch_dir"])
+    lock_rows = _cached_dir_load(load_lock_inventory, ctx["lock_dir"])
+    return _inventory_payload_from_records(ctx, classify_records(pid_rows, lock_rows))
 
-    pid_rows = load_pid_inventory(ctx["orch_dir"])
-    lock_rows = load_lock_inventory(ctx["lock_dir"])
-    records = classify_records(pid_rows, lock_rows)
 
+def _inventory_payload_from_records(ctx: dict[str, Any], records: list[dict[str, Any]]) -> dict[str, Any]:
     return {
-        "repo_root": str(repo_root),
+        "repo_root": ctx["repo_root"],
         "state_dir": ctx["state_dir"],
         "scripts": {
-            "codex_tasks": str(Path(__file__).resolve().parents[1] / "codex-tasks"),
+            "codex_tasks": _CODEX_TASKS_BIN,
         },
         "workers": records,
         "summary": summarize(records),
     }
 
 
+_INVENTORY_COLS = (
+    "key",
+    "task_id",
+    "owner",
+    "scope",
+    "state",
+    "pid",
+    "pid_alive",
+    "pid_file",
+    "lock_file",
+    "worktree",
+    "tmux_session",
+    "worktree_exists",
+    "stale",
+)
+_inventory_cols = itemgetter(*_INVENTORY_COLS)
+
+
+def _worker_tsv_line(row: dict[str, Any], with_stale: bool = False) -> str:
+    # Shared by inventory (13 columns) and select-stop/select-stale (12, no stale).
+    key, task_id, owner, scope, state, pid, alive, pid_file, lock_file, worktree, session, wt_exists, stale = (
+        _inventory_cols(row)
+    )
+    line = (
+        f"{key}\t{task_id}\t{owner}\t{scope}\t{state}\t{pid or ''}\t{'1' if alive else '0'}\t"
+        f"{pid_file or ''}\t{lock_file or ''}\t{worktree or ''}\t{session or ''}\t"
+        f"{'1' if wt_exists else '0'}"
+    )
+    if with_stale:
+        return f"{line}\t{'1' if stale else '0'}\n"
+    return f"{line}\n"
+
+
+def _inventory_tsv_line(row: dict[str, Any]) -> str:
+    return _worker_tsv_line(row, with_stale=True)
+
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+# Rows per os.writev call; the kernel rejects more than IOV_MAX buffers.
+_IOV_MAX = min(_IOV_MAX, 1024) if _IOV_MAX > 0 else 1024
+
+
+def _write_tsv_lines(lines: Any) -> None:
+    # Encode each row ourselves and hand the bytes to the buffered writer,
+    # bypassing the TextIOWrapper encode per write.
+    rows = [line.encode("utf-8", "surrogateescape") for line in lines]
+    if not rows:
+        return
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    writev = getattr(os, "writev", None)
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        writev = None
+    if writev is None:
+        out.writelines(rows)
+        return
+    out.flush()
+    for start in range(0, len(rows), _IOV_MAX):
+        chunk = rows[start:start + _IOV_MAX]
+        written = writev(fd, chunk)
+        total = sum(map(len, chunk))
+        if written < total:
+            # Short write (e.g. interrupted pipe write): finish the rest plainly.
+            rest = memoryview(b"".join(chunk))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+
+
+def _emit_tsv(rows: Any) -> None:
+    # rows: iterable of str sequences, one per output line.
+    _write_tsv_lines("\t".join(row) + "\n" for row in rows)
+
+
 def cmd_inventory(args: argparse.Namespace) -> None:
-    payload = _inventory_payload(args)
     if args.format == "tsv":
-        for row in payload["workers"]:
-            print(
-                "\t".join(
-                    [
-                        row["key"],
-                        row["task_id"],
-                        row["owner"],
-                        row["scope"],
-                        row["state"],
-                        str(row["pid"] or ""),
-                        "1" if row["pid_alive"] else "0",
-                        str(row["pid_file"] or ""),
-                        str(row["lock_file"] or ""),
-                        str(row["worktree"] or ""),
-                        str(row["tmux_session"] or ""),
-                        "1" if row["worktree_exists"] else "0",
-                        "1" if row["stale"] else "0",
-                    ]
-                )
-            )
+        # TSV needs neither the summary nor the full worker list; classify and
+        # format each record in one pass.
+        _, ctx, _ = load_ctx(args)
+        workers = iter_classified_records(
+            _cached_dir_load(load_pid_inventory, ctx["orch_dir"]),
+            _cached_dir_load(load_lock_inventory, ctx["lock_dir"]),
+        )
+        _write_tsv_lines(map(_inventory_tsv_line, workers))
         return
 
-    print(json.dumps(payload, ensure_ascii=False, indent=2))
+    payload = _build_inventory_payload(_ready_args(args))
+    _write_json(payload)
 
 
-def _task_board_payload(args: argparse.Namespace) -> dict[str, Any]:
+def _task_board_payload(args: ReadyArgs) -> dict[str, Any]:
     _, ctx, _ = load_ctx(args)
+    return _task_board_payload_from_ctx(ctx)
 
-    ensure_todo_file(ctx["todo_file"])
-    tasks, _ = parse_todo(ctx["todo_file"], ctx["todo"])
+
+def _task_board_payload_from_ctx(ctx: dict[str, Any], tasks: list[dict[str, str]] | None = None) -> dict[str, Any]:
+    if tasks is None:
+        ensure_todo_file(ctx["todo_file"])
+        tasks, _ = _parse_todo_cached(ctx["todo_file"], ctx["todo"])
 
     rows: list[dict[str, str]] = []
     status_counts: dict[str, int] = {}
+    owners_by_key = ctx["owners_by_key"]
+    # Raw owner -> scope; a board has few distinct owners across many rows.
+    scope_by_owner: dict[str, str] = {}
 
     for task in tasks:
         status = str(task.get("status") or "")
         owner = str(task.get("owner") or "")
+        scope = scope_by_owner.get(owner)
+        if scope is None:
+            scope = scope_by_owner[owner] = str(owners_by_key.get(_owner_key(owner), ""))
         rows.append(
             {
                 "task_id": str(task.get("id") or ""),
                 "title": str(task.get("title") or ""),
                 "owner": owner,
-                "scope": str(ctx["owners_by_key"].get(owner_key(owner), "")),
+                "scope": scope,
                 "deps": str(task.get("deps") or ""),
                 "status": status,
             }
@@ -439,10 +823,15 @@ def _parse_markdown_row(line: str) -> list[str] | None:
     if not (text.startswith("|") and text.endswith("|")):
         return None
 
+    inner = text[1:-1]
+    if "\\" not in inner:
+        # No escapes: every pipe is a cell separator.
+        return [cell.strip() for cell in inner.split("|")]
+
     cells: list[str] = []
     buf: list[str] = []
     escaped = False
-    for ch in text[1:-1]:
+    for ch in inner:
         if escaped:
             if ch == "|":
                 buf.append("|")
@@ -467,36 +856,82 @@ def _parse_markdown_row(line: str) -> list[str] | None:
 
 def _updates_payload(args: argparse.Namespace, limit: int = 200) -> dict[str, Any]:
     _, ctx, _ = load_ctx(args)
+    return _updates_payload_from_ctx(ctx, limit)
+
+
+_UPDATES_TAIL_BYTES = 128 * 1024
+# (updates_file, limit) -> (st_mtime_ns, st_size, entries, newest first)
+_UPDATES_CACHE: dict[tuple[str, int], tuple[int, int, list[dict[str, str]]]] = {}
+
+
+def _parse_update_lines(lines: list[str], limit: int) -> list[dict[str, str]]:
+    # Walk from the newest line back and stop once `limit` rows are found.
+    entries: list[dict[str, str]] = []
+    for line in reversed(lines):
+        cells = _parse_markdown_row(line)
+        if not cells or len(cells) < 5:
+            continue
+        if cells[0].lower().startswith("timestamp"):
+            continue
+        if all(not cell or set(cell) <= {"-"} for cell in cells):
+            continue
+        entries.append(
+            {
+                "timestamp": cells[0],
+                "agent": cells[1],
+                "task_id": cells[2],
+                "status": cells[3],
+                "summary": cells[4],
+            }
+        )
+        if len(entries) == limit:
+            break
+    return entries
+
+
+def _read_update_entries(updates_file: Path, limit: int) -> list[dict[str, str]]:
+    # The updates log is append-only, so only its tail is read. The window
+    # doubles until it holds `limit` entries or covers the whole file.
+    with updates_file.open("rb") as fh:
+        size = fh.seek(0, 2)
+        window = _UPDATES_TAIL_BYTES
+        while True:
+            start = max(0, size - window) if limit > 0 else 0
+            fh.seek(start)
+            lines = fh.read(size - start).decode("utf-8", errors="replace").splitlines()
+            if start > 0:
+                # First line may be cut; it is older than everything kept.
+                lines = lines[1:]
+            entries = _parse_update_lines(lines, limit)
+            if start == 0 or len(entries) >= limit:
+                break
+            window *= 2
+
+    return entries
+
+
+def _updates_payload_from_ctx(ctx: dict[str, Any], limit: int = 200) -> dict[str, Any]:
     updates_file = Path(ctx["updates_file"])
     entries: list[dict[str, str]] = []
 
-    if updates_file.exists():
-        try:
-            lines = updates_file.read_text(encoding="utf-8").splitlines()
-        except OSError:
-            lines = []
-        for line in lines:
-            cells = _parse_markdown_row(line)
-            if not cells or len(cells) < 5:
-                continue
-            if cells[0].lower().startswith("timestamp"):
-                continue
-            if all(not cell or set(cell) <= {"-"} for cell in cells):
-                continue
-            entries.append(
-                {
-                    "timestamp": cells[0],
-                    "agent": cells[1],
-                    "task_id": cells[2],
-                    "status": cells[3],
-                    "summary": cells[4],
-                }
-            )
-
-    if limit > 0:
-        entries = entries[-limit:]
+    try:
+        st = updates_file.stat()
+    except OSError:
+        st = None
+    if st is not None:
+        cache_key = (str(updates_file), limit)
+        cached = _UPDATES_CACHE.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            entries = cached[2]
+        else:
+            try:
+                entries = _read_update_entries(updates_file, limit)
+            except OSError:
+                entries = []
+            else:
+                _UPDATES_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, entries)
 
-    ordered_entries = list(reversed(entries))
+    ordered_entries = list(entries)
     return {
         "updates_file": str(updates_file),
         "entries": ordered_entries,
@@ -506,11 +941,88 @@ def _updates_payload(args: argparse.Namespace, limit: int = 200) -> dict[str, An
     }
 
 
-def _status_payload(args: argparse.Namespace) -> dict[str, Any]:
-    ready_payload = _ready_payload(args)
-    inventory_payload = _inventory_payload(args)
-    task_board_payload = _task_board_payload(args)
-    updates_payload = _updates_payload(args)
+# (repo, state_dir, config, trigger, max_start) -> (fingerprint, payload); one entry.
+_STATUS_FINGERPRINT_CACHE: dict[tuple[Any, ...], tuple[tuple[Any, ...], dict[str, Any]]] = {}
+
+
+def _stat_sig(path: str) -> tuple[int, int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (-1, -1)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _status_fingerprint(ctx: dict[str, Any]) -> tuple[Any, ...]:
+    # Lock/pid and spec files are listed individually because in-place
+    # edits keep the directory mtime.
+    specs: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(Path(ctx["repo_root"]) / "tasks" / "specs") as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                specs.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    specs.sort()
+    return (
+        _stat_sig(ctx["todo_file"]),
+        _dir_signature(ctx["lock_dir"]),
+        _dir_signature(ctx["orch_dir"]),
+        _stat_sig(ctx["config_path"]),
+        _stat_sig(ctx["updates_file"]),
+        tuple(specs),
+    )
+
+
+def _workers_unchanged(payload: dict[str, Any]) -> bool:
+    # Process exits and removed worktrees leave no trace in the directory
+    # mtimes, so re-probe what the cached payload recorded.
+    for worker in payload.get("runtime", {}).get("workers", []):
+        pid = worker.get("pid")
+        if bool(worker.get("pid_file")) and is_pid_alive(str(pid or "")) != bool(worker.get("pid_alive")):
+            return False
+        worktree = worker.get("worktree")
+        if worktree and os.path.exists(worktree) != bool(worker.get("worktree_exists")):
+            return False
+    return True
+
+
+def _status_payload_cached(args: ReadyArgs, force: bool = False) -> dict[str, Any]:
+    _, ctx, _ = load_ctx(args)
+    key = (args.repo, args.state_dir, args.config, args.trigger, args.max_start)
+    # Fingerprint before building, so changes made during the build show up
+    # as a mismatch on the next call.
+    fingerprint = _status_fingerprint(ctx)
+    cached = _STATUS_FINGERPRINT_CACHE.get(key)
+    if not force and cached is not None and cached[0] == fingerprint and _workers_unchanged(cached[1]):
+        return cached[1]
+
+    payload = _build_status_payload(args, ctx)
+    _STATUS_FINGERPRINT_CACHE.clear()
+    _STATUS_FINGERPRINT_CACHE[key] = (fingerprint, payload)
+    return payload
+
+
+def _build_status_payload(args: ReadyArgs, ctx: dict[str, Any] | None = None) -> dict[str, Any]:
+    # Resolve the repo and config once and share them across all sections.
+    if ctx is None:
+        _, ctx, _ = load_ctx(args)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The update log is independent of the TODO/lock/pid state; read it while
+    # that state is collected once and shared by the other three sections.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        updates_future = pool.submit(_updates_payload_from_ctx, ctx)
+        state = _collect_state(ctx, parallel=True)
+        ready_payload = _ready_payload_from_state(state, args)
+        inventory_payload = _inventory_payload_from_records(ctx, state.records)
+        task_board_payload = _task_board_payload_from_ctx(ctx, state.tasks)
+        updates_payload = updates_future.result()
 
     counts = inventory_payload.get("summary", {}).get("state_counts", {})
     stale_total = sum(
@@ -560,61 +1072,66 @@ def _render_status_text(payload: dict[str, Any]) -> str:
     ready_tasks = scheduler.get("ready_tasks", [])
     excluded_tasks = scheduler.get("excluded_tasks", [])
     active_locks = coordination.get("active_locks", [])
-    state_counts = runtime.get("summary", {}).get("state_counts", {})
-
-    lines: list[str] = []
-    lines.append(f"Repo: {payload.get('repo_root', '')}")
-    lines.append(f"State dir: {payload.get('state_dir', '')}")
-    lines.append(f"Trigger: {scheduler.get('trigger', 'manual')}")
-    lines.append(f"Max start: {scheduler.get('max_start', 0)}")
-    lines.append("")
-
-    lines.append(
+    scheduler_summary = scheduler.get("summary", {})
+    runtime_summary = runtime.get("summary", {})
+    coordination_summary = coordination.get("summary", {})
+    state_counts = runtime_summary.get("state_counts", {})
+
+    lines: list[str] = [
+        f"Repo: {payload.get('repo_root', '')}",
+        f"State dir: {payload.get('state_dir', '')}",
+        f"Trigger: {scheduler.get('trigger', 'manual')}",
+        f"Max start: {scheduler.get('max_start', 0)}",
+        "",
         "Scheduler: "
-        f"ready={scheduler.get('summary', {}).get('ready', 0)} "
-        f"excluded={scheduler.get('summary', {}).get('excluded', 0)}"
+        f"ready={scheduler_summary.get('ready', 0)} "
+        f"excluded={scheduler_summary.get('excluded', 0)}",
+    ]
+    lines.extend(
+        f"  [READY] {item.get('task_id', '')} owner={item.get('owner', '')} deps={item.get('deps', '')}"
+        for item in ready_tasks
+    )
+    lines.extend(
+        f"  [EXCLUDED] {item.get('task_id', '')} owner={item.get('owner', '')} "
+        f"reason={item.get('reason', '')} source={item.get('source', '')}"
+        for item in excluded_tasks
     )
-    for item in ready_tasks:
-        lines.append(
-            f"  [READY] {item.get('task_id', '')} owner={item.get('owner', '')} deps={item.get('deps', '')}")
-    for item in excluded_tasks:
-        lines.append(
-            f"  [EXCLUDED] {item.get('task_id', '')} owner={item.get('owner', '')} "
-            f"reason={item.get('reason', '')} source={item.get('source', '')}"
-        )
 
-    lines.append("")
-    lines.append(
-        "Runtime: "
-        f"total={runtime.get('summary', {}).get('total', 0)} "
-        f"active={runtime.get('summary', {}).get('active', 0)} "
-        f"stale={runtime.get('summary', {}).get('stale', 0)}"
+    lines.extend(
+        (
+            "",
+            "Runtime: "
+            f"total={runtime_summary.get('total', 0)} "
+            f"active={runtime_summary.get('active', 0)} "
+            f"stale={runtime_summary.get('stale', 0)}",
+        )
     )
     if state_counts:
-        ordered = sorted(state_counts.items(), key=lambda x: x[0])
-        lines.append("  states=" + ", ".join(f"{k}:{v}" for k, v in ordered))
+        lines.append("  states=" + ", ".join(f"{k}:{v}" for k, v in sorted(state_counts.items())))
 
-    lines.append("")
-    lines.append(
-        f"Coordination: locks={coordination.get('summary', {}).get('locks', 0)}")
-    for lock in active_locks:
-        lines.append(
-            f"  [LOCK] scope={lock.get('scope', '')} owner={lock.get('owner', '')} task={lock.get('task_id', '')}")
+    lines.extend(("", f"Coordination: locks={coordination_summary.get('locks', 0)}"))
+    lines.extend(
+        f"  [LOCK] scope={lock.get('scope', '')} owner={lock.get('owner', '')} task={lock.get('task_id', '')}"
+        for lock in active_locks
+    )
 
     return "\n".join(lines)
 
 
-def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -> None:
+def _run_status_tui(args: ReadyArgs, initial_payload: dict[str, Any]) -> None:
     try:
         from rich.console import Group
         from rich.markdown import Markdown as RichMarkdown
         from rich.padding import Padding
         from rich.syntax import Syntax
         from rich.text import Text
+        from textual import work
         from textual.app import App, ComposeResult
         from textual.containers import Grid, Container, Horizontal, VerticalScroll
+        from textual.coordinate import Coordinate
         from textual.screen import ModalScreen
         from textual.widgets import Button, DataTable, Static, TabbedContent, TabPane
+        from textual.worker import get_current_worker
     except ModuleNotFoundError:
         die("Textual is not installed. Install with: pip install textual")
 
@@ -623,7 +1140,32 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
     except ImportError:
         Markdown = None  # type: ignore[assignment]
 
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ModuleNotFoundError:
+        FileSystemEventHandler = object  # type: ignore[assignment,misc]
+        Observer = None  # type: ignore[assignment,misc]
+
+    import asyncio
+    import hashlib
+    from collections import Counter
+    from datetime import datetime
+
+    from session_parser import SessionBlock, SessionView, parse_session_structured, read_tail_text
+
     refresh_seconds = 2.0
+    # With file watching, idle ticks are skipped, but every Nth tick still
+    # refreshes: pid liveness and worktree removal produce no events here.
+    forced_refresh_ticks = 5
+
+    class _DirtyHandler(FileSystemEventHandler):  # type: ignore[misc,valid-type]
+        def __init__(self, app: Any) -> None:
+            super().__init__()
+            self.app = app
+
+        def on_any_event(self, event: Any) -> None:
+            self.app.fs_dirty = True
 
     class ActionConfirmModal(ModalScreen[bool]):
         CSS = """
@@ -849,6 +1391,8 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             self.last_parse_source = "transcript"
             self.last_parsed_events = 0
             self.spinner_tick = 0
+            # (view_mode, pane content, log tail) of the last rendered body.
+            self._rendered_key: tuple[str, str, str] | None = None
 
         def _build_meta_text(self) -> str:
             backend_display = self.launch_backend or "N/A"
@@ -1187,6 +1731,7 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 pass
 
         def _set_message(self, message: str, style: str = "yellow") -> None:
+            self._rendered_key = None
             structured_widget = self.query_one("#agent_session_body_structured", Static)
             structured_widget.update(Text(message, style=style))
 
@@ -1232,24 +1777,26 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 self._set_meta()
                 return
 
-            has_session = subprocess.run(
-                ["tmux", "has-session", "-t", self.tmux_session],
-                capture_output=True,
-                text=True,
-            )
-            if has_session.returncode != 0:
-                self.last_parse_source = "tmux"
-                self.last_parsed_events = 0
-                self._set_message(f"tmux session is not available: {self.tmux_session}", style="yellow")
-                self._set_meta()
-                return
-
+            # capture-pane fails on a missing session too, so has-session is only
+            # spawned on failure to pick the right message.
             capture = subprocess.run(
                 ["tmux", "capture-pane", "-e", "-p", "-t", self.tmux_session, "-S", "-300"],
                 capture_output=True,
                 text=True,
             )
             if capture.returncode != 0:
+                has_session = subprocess.run(
+                    ["tmux", "has-session", "-t", self.tmux_session],
+                    capture_output=True,
+                    text=True,
+                )
+                if has_session.returncode != 0:
+                    self.last_parse_source = "tmux"
+                    self.last_parsed_events = 0
+                    self._set_message(f"tmux session is not available: {self.tmux_session}", style="yellow")
+                    self._set_meta()
+                    return
+
                 detail = capture.stderr.strip() or capture.stdout.strip() or "unknown error"
                 self.last_parse_source = "tmux"
                 self.last_parsed_events = 0
@@ -1261,14 +1808,25 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             if not content.strip():
                 content = "(No output yet)"
 
-            self._set_raw_body(content)
+            # An idle pane captures the same text every tick; skip the ANSI and
+            # session parsing when nothing on screen would change.
             if self.view_mode == "raw":
+                render_key = ("raw", content, "")
+                if render_key == self._rendered_key:
+                    return
+                self._set_raw_body(content)
                 self.last_parse_source = "ansi"
                 self.last_parsed_events = 0
                 self._set_meta()
+                self._rendered_key = render_key
                 return
 
             log_tail = read_tail_text(self.log_file) if self.log_file and self.log_file != "N/A" else ""
+            render_key = ("structured", content, log_tail)
+            if render_key == self._rendered_key:
+                return
+
+            self._set_raw_body(content)
             structured = parse_session_structured(
                 content,
                 log_tail=log_tail,
@@ -1279,6 +1837,7 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             self.last_parsed_events = structured.parsed_events
             self._set_structured_body(structured)
             self._set_meta()
+            self._rendered_key = render_key
 
         def action_toggle_view(self) -> None:
             self.view_mode = "raw" if self.view_mode == "structured" else "structured"
@@ -1413,16 +1972,52 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             ("ctrl+e", "emergency_stop", "Stop-All"),
         ]
 
+        # Logo and version never change while the dashboard runs.
+        LOGO_LINES: tuple[Text, ...] = (
+            *(
+                Text(line, style="bold")
+                for line in (
+                    "█▀▀ █▀█ █▀▄ █▀▀ █ █  ▀█▀ █▀█ █▀▀ █ █ █▀▀",
+                    "█   █ █ █ █ █▀▀ ▄▀▄   █  █▀█ ▀▀█ █▀▄ ▀▀█",
+                    "▀▀▀ ▀▀▀ ▀▀  ▀▀▀ ▀ ▀   ▀  ▀ ▀ ▀▀▀ ▀ ▀ ▀▀▀",
+                )
+            ),
+            Text(f"CODEX TASKS v{_read_version()}", style="bold"),
+        )
+
         def __init__(self) -> None:
             super().__init__()
             self.current_payload: dict[str, Any] = initial_payload
-            self.last_payload_signature = ""
+            # Overview header (logo, repo, state dir), rebuilt when paths change.
+            self.header_source: tuple[str, str] | None = None
+            self.header_lines: list[Text] = []
+            self.last_payload_signature = b""
             self.last_error: str = ""
             self.last_action: str = ""
             self.refresh_in_flight = False
+            self.refresh_generation = 0
+            self.render_scheduled = False
             self.active_bottom_tab = "tasks_tab"
             self.running_worker_index: dict[tuple[str, str, str], dict[str, Any]] = {}
             self.agent_modal_open = False
+            self.fs_observer: Any = None
+            # Plain inputs each widget was last rendered from, by widget id.
+            self.rendered_sources: dict[str, Any] = {}
+            # The initial payload came through the fingerprint cache, so the
+            # first tick can check the fingerprint instead of forcing a build.
+            self.fs_dirty = False
+            self.idle_ticks = 0
+            self.refresh_timer: Any = None
+            self.last_refresh_mono = 0.0
+            # Widget handles, looked up once in on_mount.
+            self.meta_box: Any = None
+            self.meta_left: Any = None
+            self.meta_right: Any = None
+            self.ready_table: Any = None
+            self.agents_table: Any = None
+            self.task_table: Any = None
+            self.log_table: Any = None
+            self.bottom_tabs: Any = None
 
         def compose(self) -> ComposeResult:
             with Grid(id="dashboard"):
@@ -1439,8 +2034,21 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
 
         @staticmethod
         def _row_key(row: list[Any] | tuple[Any, ...], key_columns: tuple[int, ...]) -> tuple[str, ...]:
+            if len(row) > max(key_columns):
+                # Common case: every key column is present and most cells are already str.
+                return tuple(
+                    value if type(value) is str else str(value) for value in map(row.__getitem__, key_columns)
+                )
             return tuple(str(row[idx]) if idx < len(row) else "" for idx in key_columns)
 
+        @staticmethod
+        def _cell_sig(value: Any) -> Any:
+            # Text.__eq__ ignores the base style, so a tone-only change (same
+            # text, new colour) would otherwise never be repainted.
+            if isinstance(value, Text):
+                return (value.plain, str(value.style), value.spans)
+            return value
+
         @staticmethod
         def _fill_table(
             table: DataTable,
@@ -1461,10 +2069,34 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 except Exception:
                     current_key = None
 
-            table.clear()
             render_rows = rows if rows else [fallback]
-            for row in render_rows:
-                table.add_row(*row)
+            # Keep the leading rows that are already on screen and replace only
+            # the tail after the first difference.
+            keep = 0
+            limit = min(table.row_count, len(render_rows))
+            cell_sig = StatusTui._cell_sig
+            while keep < limit and list(map(cell_sig, table.get_row_at(keep))) == list(
+                map(cell_sig, render_rows[keep])
+            ):
+                keep += 1
+            if keep < len(render_rows) and table.row_count == len(render_rows):
+                # Same row count (e.g. a status flip): patch only the cells
+                # that differ and keep the rows themselves.
+                for row_index in range(keep, len(render_rows)):
+                    current_row = table.get_row_at(row_index)
+                    for column_index, value in enumerate(render_rows[row_index]):
+                        if cell_sig(current_row[column_index]) != cell_sig(value):
+                            table.update_cell_at(
+                                Coordinate(row_index, column_index), value, update_width=True)
+            else:
+                if keep == 0:
+                    table.clear()
+                else:
+                    for stale_row in table.ordered_rows[keep:]:
+                        table.remove_row(stale_row.key)
+                # DataTable only renders the lines in view; batch the inserts so
+                # the table recomputes its layout once instead of once per row.
+                table.add_rows(render_rows[keep:])
 
             target_row = 0
             if current_key is not None and rows:
@@ -1492,11 +2124,26 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 table.focus()
 
         @staticmethod
+        @lru_cache(maxsize=256)
         def _compact_path(value: str, keep: int = 100) -> str:
             if len(value) <= keep:
                 return value
             return f"...{value[-(keep - 3):]}"
 
+        # (message, confirm label) for the action confirmation modals.
+        STOP_CONFIRM = (
+            "This action will run:\n\n"
+            "codex-tasks task stop --all --apply\n\n"
+            "Are you sure you want to proceed?",
+            "Yes (Y)",
+        )
+        START_CONFIRM = (
+            "This action will run:\n\n"
+            "codex-tasks run start\n\n"
+            "Are you sure you want to proceed?",
+            "Yes (Y)",
+        )
+
         STATUS_TONES: dict[str, str] = {
             "TODO": "cyan",
             "IN_PROGRESS": "yellow",
@@ -1504,41 +2151,50 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             "DONE": "green",
         }
 
+        # (tone, dim, bold) -> style string, for every tone including the fallback.
+        STYLE_CACHE: dict[tuple[str, bool, bool], str] = {
+            (tone, dim, bold): " ".join((["dim"] if dim else []) + (["bold"] if bold else []) + [tone])
+            for tone in (*STATUS_TONES.values(), "white")
+            for dim in (False, True)
+            for bold in (False, True)
+        }
+
         @classmethod
         def _status_style(cls, value: str, *, dim: bool = False, bold: bool = False) -> str:
             tone = cls.STATUS_TONES.get(value.strip().upper(), "white")
-            tokens: list[str] = []
-            if dim:
-                tokens.append("dim")
-            if bold:
-                tokens.append("bold")
-            tokens.append(tone)
-            return " ".join(tokens)
+            return cls.STYLE_CACHE[(tone, dim, bold)]
 
         @classmethod
         def _status_cell(cls, value: str, *, dim: bool = True, bold: bool = False) -> Text:
             return Text(value, style=cls._status_style(value, dim=dim, bold=bold))
 
         @staticmethod
+        @lru_cache(maxsize=1024)
         def _normalize_task_id(value: Any) -> str:
             text = str(value or "").strip()
+            if "`" not in text:
+                return text.lower()
             while len(text) >= 2 and text.startswith("`") and text.endswith("`"):
                 text = text[1:-1].strip()
             return text.lower()
 
         @staticmethod
-        def _payload_signature(payload: dict[str, Any]) -> str:
-            return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        def _payload_signature(payload: dict[str, Any]) -> bytes:
+            # Only a 16-byte digest is kept between ticks, not the serialization.
+            data = _json_bytes(payload, sort_keys=True)
+            return hashlib.blake2b(data, digest_size=16).digest()
 
         @staticmethod
-        def _ratio_bar(segments: list[tuple[str, int, str]], width: int = 32) -> Text:
+        @lru_cache(maxsize=64)
+        def _ratio_bar(segments: tuple[tuple[str, int, str], ...], width: int = 32) -> Text:
+            # Cached per (segments, width); callers only append_text() the result.
             total = sum(max(0, count) for _, count, _ in segments)
             if total <= 0:
                 return Text("-" * width, style="dim")
 
             remaining_total = total
             remaining_width = width
-            bar = Text()
+            parts: list[tuple[str, str]] = []
             for idx, (symbol, count, style) in enumerate(segments):
                 value = max(0, count)
                 if idx == len(segments) - 1:
@@ -1548,20 +2204,33 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                                 remaining_width) if remaining_total > 0 else 0
                     units = max(0, min(remaining_width, units))
                 if units > 0:
-                    bar.append(symbol * units, style=style)
+                    parts.append((symbol * units, style))
                 remaining_width -= units
                 remaining_total -= value
 
             if remaining_width > 0:
-                bar.append("-" * remaining_width, style="dim")
-            return bar
+                parts.append(("-" * remaining_width, "dim"))
+            return Text.assemble(*parts)
 
         @staticmethod
+        @lru_cache(maxsize=256)
         def _compact_text(value: str, keep: int = 200) -> str:
             if len(value) <= keep:
                 return value
             return f"{value[:keep - 3]}..."
 
+        def _schedule_render(self) -> None:
+            # Triggers that land in the same cycle (refresh result, action
+            # status, tab switch) collapse into one render after the next paint.
+            if self.render_scheduled:
+                return
+            self.render_scheduled = True
+            self.call_after_refresh(self._flush_render)
+
+        def _flush_render(self) -> None:
+            self.render_scheduled = False
+            self._render_payload()
+
         def _render_payload(self) -> None:
             payload = self.current_payload
             scheduler = payload.get("scheduler", {})
@@ -1574,38 +2243,29 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 worker for worker in runtime.get("workers", []) if bool(worker.get("pid_alive"))
             ]
             active_label = "Task" if self.active_bottom_tab == "tasks_tab" else "Log"
-            running_task_ids = {
-                task_id
-                for task_id in (
-                    self._normalize_task_id(worker.get("task_id", "")) for worker in running_workers
-                )
-                if task_id
-            }
-            task_ids_in_board: set[str] = set()
+            running_task_ids = frozenset(
+                filter(None, (self._normalize_task_id(worker.get("task_id", "")) for worker in running_workers))
+            )
+            # Normalize each task id once; the task table below reuses the pairs.
+            normalized_items = [
+                (item, self._normalize_task_id(item.get("task_id", ""))) for item in task_items
+            ]
+            task_ids_in_board = {task_id for _, task_id in normalized_items if task_id}
+            status_counter = Counter(
+                "IN_PROGRESS" if task_id in running_task_ids else str(item.get("status", "")).strip().upper()
+                for item, task_id in normalized_items
+            )
             effective_status_counts: dict[str, int] = {
-                "DONE": 0,
-                "TODO": 0,
-                "BLOCKED": 0,
-                "IN_PROGRESS": 0,
+                status: status_counter[status] for status in ("DONE", "TODO", "BLOCKED", "IN_PROGRESS")
             }
-            for item in task_items:
-                normalized_task_id = self._normalize_task_id(item.get("task_id", ""))
-                if normalized_task_id:
-                    task_ids_in_board.add(normalized_task_id)
-                raw_status = str(item.get("status", "")).strip().upper()
-                effective_status = (
-                    "IN_PROGRESS" if normalized_task_id and normalized_task_id in running_task_ids else raw_status
-                )
-                if effective_status in effective_status_counts:
-                    effective_status_counts[effective_status] += 1
 
             orphan_running_task_ids = running_task_ids - task_ids_in_board
             if orphan_running_task_ids:
                 effective_status_counts["IN_PROGRESS"] += len(orphan_running_task_ids)
 
-            meta = self.query_one("#meta", Horizontal)
-            meta_left = self.query_one("#meta_left", Static)
-            meta_right = self.query_one("#meta_right", Static)
+            meta = self.meta_box
+            meta_left = self.meta_left
+            meta_right = self.meta_right
             refreshed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             repo_root = str(payload.get("repo_root", ""))
             state_dir = str(payload.get("state_dir", ""))
@@ -1633,128 +2293,144 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                              100.0) if tasks_total > 0 else 0.0
             in_progress_ratio = (in_progress_count / tasks_total *
                                  100.0) if tasks_total > 0 else 0.0
-            status_bar = self._ratio_bar(
-                [
-                    ("◼", ready_count, "bold #5d8761"),
-                    ("◼", running_agents_count, "bold #9a7a40"),
-                    ("◼", status_remaining, "bold dim"),
-                ]
-            )
-            tasks_bar = self._ratio_bar(
-                [
-                    ("◼", done_count, self._status_style(
-                        "DONE", bold=True, dim=True)),
-                    ("◼", todo_count, self._status_style(
-                        "TODO", bold=True, dim=True)),
-                    ("◼", in_progress_count, self._status_style(
-                        "IN_PROGRESS", bold=True, dim=True)),
-                    ("◼", blocked_count, self._status_style(
-                        "BLOCKED", bold=True, dim=True)),
-                ]
+            meta_source = (
+                repo_root,
+                state_dir,
+                scheduler.get("trigger", "manual"),
+                scheduler.get("max_start", 0),
+                ready_count,
+                running_agents_count,
+                status_total,
+                done_count,
+                todo_count,
+                blocked_count,
+                in_progress_count,
+                tuple(
+                    (lock.get("task_id", ""), lock.get("owner", ""), lock.get("scope", ""))
+                    for lock in active_locks
+                ),
+                self.last_error,
             )
-            lock_labels: list[str] = []
-            for lock in active_locks:
-                task_id = str(lock.get("task_id", "")).strip() or "N/A"
-                owner = str(lock.get("owner", "")).strip()
-                scope = str(lock.get("scope", "")).strip()
-                suffix = ""
-                if owner or scope:
-                    suffix = f"@{owner}/{scope}".rstrip("/")
-                lock_labels.append(f"{task_id}{suffix}")
-            locks_joined = self._compact_text(
-                ", ".join(lock_labels) if lock_labels else "-")
-            logo_lines = [
-                "█▀▀ █▀█ █▀▄ █▀▀ █ █  ▀█▀ █▀█ █▀▀ █ █ █▀▀",
-                "█   █ █ █ █ █▀▀ ▄▀▄   █  █▀█ ▀▀█ █▀▄ ▀▀█",
-                "▀▀▀ ▀▀▀ ▀▀  ▀▀▀ ▀ ▀   ▀  ▀ ▀ ▀▀▀ ▀ ▀ ▀▀▀",
-            ]
-            render_lines: list[Text] = [
-                Text(line, style="bold") for line in logo_lines]
-            render_lines.append(Text(f"CODEX TASKS v{_read_version()}", style="bold"))
-            render_lines.append(Text(""))
-            render_lines.append(
-                Text(f"Repo       {self._compact_path(repo_root)}"))
-            render_lines.append(
-                Text(f"State Dir  {self._compact_path(state_dir)}"))
-            render_lines.append(Text(""))
-            render_lines.append(
-                Text(
-                    f"Configs    trigger={scheduler.get('trigger', 'manual')} "
-                    f"max_start={scheduler.get('max_start', 0)}",
-                    style="dim",
+            if self.rendered_sources.get("meta") != meta_source:
+                self.rendered_sources["meta"] = meta_source
+                status_bar = self._ratio_bar(
+                    (
+                        ("◼", ready_count, "bold #5d8761"),
+                        ("◼", running_agents_count, "bold #9a7a40"),
+                        ("◼", status_remaining, "bold dim"),
+                    )
                 )
-            )
-            render_lines.append(Text(""))
-
-            tasks_line = Text("Tasks      ")
-            tasks_line.append("[", style="dim")
-            tasks_line.append_text(tasks_bar)
-            tasks_line.append("]", style="dim")
-            tasks_line.append(" (", style="dim")
-            tasks_line.append(
-                f"done={done_count}",
-                style=self._status_style("DONE", bold=False, dim=True),
-            )
-            tasks_line.append(", ", style="dim")
-            tasks_line.append(
-                f"todo={todo_count}",
-                style=self._status_style("TODO", bold=False, dim=True),
-            )
-            tasks_line.append(", ", style="dim")
-            tasks_line.append(
-                f"in_progress={in_progress_count}",
-                style=self._status_style("IN_PROGRESS", bold=False, dim=True),
-            )
-            tasks_line.append(", ", style="dim")
-            tasks_line.append(
-                f"blocked={blocked_count}",
-                style=self._status_style("BLOCKED", bold=False, dim=True),
-            )
-            tasks_line.append(")", style="dim")
-            render_lines.append(tasks_line)
-
-            status_line = Text("Status     ")
-            status_line.append("[", style="dim")
-            status_line.append_text(status_bar)
-            status_line.append("]", style="dim")
-            status_line.append(" (", style="dim")
-            status_line.append(f"total={status_total}", style="dim")
-            status_line.append(", ", style="dim")
-            status_line.append(
-                f"ready={ready_count}", style="#5d8761")
-            status_line.append(", ", style="dim")
-            status_line.append(
-                f"running={running_agents_count}", style="#9a7a40")
-            status_line.append(")", style="dim")
-            render_lines.append(status_line)
-
-            render_lines.append(Text(""))
-            render_lines.append(
-                Text(f"Locks      {locks_joined}", style="#4d6f99"))
-
-            if self.last_error:
-                render_lines.append(
-                    Text(f"Last Error  {self.last_error}", style="bold red"))
-
-            meta_left.update(Group(*render_lines))
-
-            palette_lines: list[Text] = [
-                Text("COMMANDS", style="bold"),
-                Text("  Ctrl+R   Run ready tasks"),
-                Text("  Ctrl+E   Stop all tasks"),
-            ]
-            if self.last_error:
-                palette_lines.extend(
-                    [
+                tasks_bar = self._ratio_bar(
+                    (
+                        ("◼", done_count, self._status_style(
+                            "DONE", bold=True, dim=True)),
+                        ("◼", todo_count, self._status_style(
+                            "TODO", bold=True, dim=True)),
+                        ("◼", in_progress_count, self._status_style(
+                            "IN_PROGRESS", bold=True, dim=True)),
+                        ("◼", blocked_count, self._status_style(
+                            "BLOCKED", bold=True, dim=True)),
+                    )
+                )
+                lock_labels: list[str] = []
+                for lock in active_locks:
+                    task_id = str(lock.get("task_id", "")).strip() or "N/A"
+                    owner = str(lock.get("owner", "")).strip()
+                    scope = str(lock.get("scope", "")).strip()
+                    suffix = ""
+                    if owner or scope:
+                        suffix = f"@{owner}/{scope}".rstrip("/")
+                    lock_labels.append(f"{task_id}{suffix}")
+                locks_joined = self._compact_text(
+                    ", ".join(lock_labels) if lock_labels else "-")
+                if self.header_source != (repo_root, state_dir):
+                    self.header_source = (repo_root, state_dir)
+                    self.header_lines = [
+                        *self.LOGO_LINES,
+                        Text(""),
+                        Text(f"Repo       {self._compact_path(repo_root)}"),
+                        Text(f"State Dir  {self._compact_path(state_dir)}"),
                         Text(""),
-                        Text("LAST ERROR", style="bold red"),
-                        Text(self.last_error, style="red"),
                     ]
+                render_lines: list[Text] = list(self.header_lines)
+                render_lines.append(
+                    Text(
+                        f"Configs    trigger={scheduler.get('trigger', 'manual')} "
+                        f"max_start={scheduler.get('max_start', 0)}",
+                        style="dim",
+                    )
+                )
+                render_lines.append(Text(""))
+
+                tasks_line = Text("Tasks      ")
+                tasks_line.append("[", style="dim")
+                tasks_line.append_text(tasks_bar)
+                tasks_line.append("]", style="dim")
+                tasks_line.append(" (", style="dim")
+                tasks_line.append(
+                    f"done={done_count}",
+                    style=self._status_style("DONE", bold=False, dim=True),
+                )
+                tasks_line.append(", ", style="dim")
+                tasks_line.append(
+                    f"todo={todo_count}",
+                    style=self._status_style("TODO", bold=False, dim=True),
+                )
+                tasks_line.append(", ", style="dim")
+                tasks_line.append(
+                    f"in_progress={in_progress_count}",
+                    style=self._status_style("IN_PROGRESS", bold=False, dim=True),
+                )
+                tasks_line.append(", ", style="dim")
+                tasks_line.append(
+                    f"blocked={blocked_count}",
+                    style=self._status_style("BLOCKED", bold=False, dim=True),
                 )
-            meta_right.update(Group(*palette_lines))
+                tasks_line.append(")", style="dim")
+                render_lines.append(tasks_line)
+
+                status_line = Text("Status     ")
+                status_line.append("[", style="dim")
+                status_line.append_text(status_bar)
+                status_line.append("]", style="dim")
+                status_line.append(" (", style="dim")
+                status_line.append(f"total={status_total}", style="dim")
+                status_line.append(", ", style="dim")
+                status_line.append(
+                    f"ready={ready_count}", style="#5d8761")
+                status_line.append(", ", style="dim")
+                status_line.append(
+                    f"running={running_agents_count}", style="#9a7a40")
+                status_line.append(")", style="dim")
+                render_lines.append(status_line)
+
+                render_lines.append(Text(""))
+                render_lines.append(
+                    Text(f"Locks      {locks_joined}", style="#4d6f99"))
+
+                if self.last_error:
+                    render_lines.append(
+                        Text(f"Last Error  {self.last_error}", style="bold red"))
+
+                meta_left.update(Group(*render_lines))
+
+                palette_lines: list[Text] = [
+                    Text("COMMANDS", style="bold"),
+                    Text("  Ctrl+R   Run ready tasks"),
+                    Text("  Ctrl+E   Stop all tasks"),
+                ]
+                if self.last_error:
+                    palette_lines.extend(
+                        [
+                            Text(""),
+                            Text("LAST ERROR", style="bold red"),
+                            Text(self.last_error, style="red"),
+                        ]
+                    )
+                meta_right.update(Group(*palette_lines))
             meta.border_subtitle = f"{refresh_seconds:.0f}s interval"
 
-            ready_table = self.query_one("#ready_table", DataTable)
+            ready_table = self.ready_table
             ready_rows = [
                 (
                     str(item.get("task_id", "")),
@@ -1764,44 +2440,45 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 )
                 for item in scheduler.get("ready_tasks", [])
             ]
-            self._fill_table(ready_table, ready_rows,
-                             ("-", "-", "-", "-"), key_columns=(0,))
+            if self.rendered_sources.get("ready_table") != ready_rows:
+                self.rendered_sources["ready_table"] = ready_rows
+                self._fill_table(ready_table, ready_rows,
+                                 ("-", "-", "-", "-"), key_columns=(0,))
 
-            agents_table = self.query_one("#agents_table", DataTable)
-            active_agents: list[tuple[Any, ...]] = []
+            agents_table = self.agents_table
+            agent_keys: list[tuple[str, str, str]] = []
             worker_index: dict[tuple[str, str, str], dict[str, Any]] = {}
             for worker in running_workers:
                 owner = str(worker.get("owner", ""))
                 task_id = str(worker.get("task_id", ""))
                 pid = str(worker.get("pid", "") or "")
-                active_agents.append(
-                    (
-                        owner,
-                        task_id,
-                        self._status_cell("IN_PROGRESS"),
-                        pid,
-                    )
-                )
-                worker_index[(owner, task_id, pid)] = worker
-            active_agents.sort(key=lambda row: (
-                row[0], row[1], str(row[2]), row[3]))
+                agent_keys.append((owner, task_id, pid))
+                # Same canonical (stripped) form _selected_agent_worker looks up.
+                worker_index[(owner.strip(), task_id.strip(), pid.strip())] = worker
+            # Every row shows the same state cell, so (owner, task, pid) orders them.
+            agent_keys.sort()
             self.running_worker_index = worker_index
-            self._fill_table(agents_table, active_agents,
-                             ("-", "-", "-", "-"), key_columns=(0, 1, 3))
+            if self.rendered_sources.get("agents_table") != agent_keys:
+                self.rendered_sources["agents_table"] = agent_keys
+                active_agents: list[tuple[Any, ...]] = [
+                    (owner, task_id, self._status_cell("IN_PROGRESS"), pid)
+                    for owner, task_id, pid in agent_keys
+                ]
+                self._fill_table(agents_table, active_agents,
+                                 ("-", "-", "-", "-"), key_columns=(0, 1, 3))
 
-            task_table = self.query_one("#task_table", DataTable)
+            task_table = self.task_table
             task_rows: list[tuple[Any, ...]] = []
-            repo_root_path = Path(repo_root) if repo_root else None
-            for item in reversed(task_items):
+            for item, normalized_task_id in reversed(normalized_items):
                 task_id = str(item.get("task_id", ""))
-                normalized_task_id = self._normalize_task_id(task_id)
                 task_status = "IN_PROGRESS" if normalized_task_id in running_task_ids else str(
                     item.get("status", ""))
                 spec_mark = "-"
-                if repo_root_path is not None and task_id:
+                if repo_root and task_id:
                     try:
-                        spec_exists = bool(evaluate_task_spec(
-                            repo_root_path, task_id).get("exists"))
+                        # Shared with the scheduler; only changed specs are re-read.
+                        spec_exists = bool(_evaluate_task_spec_cached(
+                            repo_root, task_id).get("exists"))
                     except Exception:
                         spec_exists = False
                     spec_mark = "O" if spec_exists else "-"
@@ -1811,27 +2488,39 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                         str(item.get("title", "")),
                         str(item.get("owner", "")),
                         str(item.get("scope", "")),
-                        self._status_cell(task_status),
+                        task_status,
                         spec_mark,
                         str(item.get("deps", "")),
                     )
                 )
-            self._fill_table(task_table, task_rows, ("-", "-",
-                             "-", "-", "-", "-", "-"), key_columns=(0,))
+            if self.rendered_sources.get("task_table") != task_rows:
+                self.rendered_sources["task_table"] = task_rows
+                self._fill_table(
+                    task_table,
+                    [row[:4] + (self._status_cell(row[4]),) + row[5:] for row in task_rows],
+                    ("-", "-", "-", "-", "-", "-", "-"),
+                    key_columns=(0,),
+                )
 
-            log_table = self.query_one("#log_table", DataTable)
+            log_table = self.log_table
             log_rows = [
                 (
                     str(entry.get("timestamp", "")),
                     str(entry.get("agent", "")),
                     str(entry.get("task_id", "")),
-                    self._status_cell(str(entry.get("status", ""))),
+                    str(entry.get("status", "")),
                     str(entry.get("summary", "")),
                 )
                 for entry in updates.get("entries", [])
             ]
-            self._fill_table(log_table, log_rows, ("-", "-",
-                             "-", "-", "-"), key_columns=(0, 1, 2, 3))
+            if self.rendered_sources.get("log_table") != log_rows:
+                self.rendered_sources["log_table"] = log_rows
+                self._fill_table(
+                    log_table,
+                    [row[:3] + (self._status_cell(row[3]),) + row[4:] for row in log_rows],
+                    ("-", "-", "-", "-", "-"),
+                    key_columns=(0, 1, 2, 3),
+                )
 
             subtitle = (
                 f"Press q to quit | Panel: {active_label} (1=Task, 2=Log) | "
@@ -1844,12 +2533,14 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 subtitle = f"{subtitle} | Last refresh failed"
             self.sub_title = subtitle
 
-        def _run_emergency_stop(self) -> None:
+        async def _run_emergency_stop(self) -> None:
             cmd = self._codex_tasks_cmd()
             cmd.extend(["task", "emergency-stop", "--yes",
                        "--reason", "requested from status tui"])
 
-            proc = subprocess.run(cmd, capture_output=True, text=True)
+            # codex-tasks is a shell script; run it off the event loop so the
+            # dashboard keeps handling input while it works.
+            proc = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True)
             if proc.returncode != 0:
                 detail = (proc.stderr.strip() or proc.stdout.strip()
                           or f"exit={proc.returncode}")
@@ -1857,32 +2548,32 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 )[0] if detail else "unknown error"
                 self.last_action = ""
                 self.last_error = f"emergency-stop failed: {first_line}"
-                self._render_payload()
+                self._schedule_render()
                 return
 
             first_line = next(
                 (line.strip() for line in proc.stdout.splitlines() if line.strip()), "")
             self.last_error = ""
             self.last_action = first_line or "Emergency stop executed"
-            self._render_payload()
-            self._refresh_payload()
+            self._schedule_render()
+            self._start_refresh(force=True)
 
         def _codex_tasks_cmd(self) -> list[str]:
-            cmd = [str(Path(__file__).resolve().parents[1] / "codex-tasks")]
+            cmd = [_CODEX_TASKS_BIN]
             repo_root = str(self.current_payload.get("repo_root", ""))
             state_dir = str(self.current_payload.get("state_dir", ""))
             if repo_root:
                 cmd.extend(["--repo", repo_root])
             if state_dir:
                 cmd.extend(["--state-dir", state_dir])
-            if getattr(args, "config", None):
+            if args.config:
                 cmd.extend(["--config", str(args.config)])
             return cmd
 
-        def _run_start(self) -> None:
+        async def _run_start(self) -> None:
             cmd = self._codex_tasks_cmd()
             cmd.extend(["run", "start"])
-            proc = subprocess.run(cmd, capture_output=True, text=True)
+            proc = await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True)
             if proc.returncode != 0:
                 detail = (proc.stderr.strip() or proc.stdout.strip()
                           or f"exit={proc.returncode}")
@@ -1890,46 +2581,131 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
                 )[0] if detail else "unknown error"
                 self.last_action = ""
                 self.last_error = f"run start failed: {first_line}"
-                self._render_payload()
+                self._schedule_render()
                 return
 
             first_line = next(
                 (line.strip() for line in proc.stdout.splitlines() if line.strip()), "")
             self.last_error = ""
             self.last_action = first_line or "Run start executed"
-            self._render_payload()
-            self._refresh_payload()
+            self._schedule_render()
+            self._start_refresh(force=True)
+
+        def _start_fs_watch(self) -> None:
+            if Observer is None:
+                return
+            try:
+                _, ctx, _ = load_ctx(args)
+            except (SystemExit, Exception):
+                return
+
+            watches = [
+                (ctx["state_dir"], True),
+                (str(Path(ctx["todo_file"]).parent), False),
+                (str(Path(ctx["repo_root"]) / "tasks" / "specs"), True),
+            ]
+            observer = Observer()
+            handler = _DirtyHandler(self)
+            scheduled = 0
+            for path, recursive in watches:
+                if not Path(path).is_dir():
+                    continue
+                try:
+                    observer.schedule(handler, path, recursive=recursive)
+                    scheduled += 1
+                except OSError:
+                    continue
+            if not scheduled:
+                return
+            try:
+                observer.daemon = True
+                observer.start()
+            except Exception:
+                return
+            self.fs_observer = observer
+
+        def _stop_fs_watch(self) -> None:
+            observer = self.fs_observer
+            self.fs_observer = None
+            if observer is not None:
+                observer.stop()
 
-        def _refresh_payload(self) -> None:
+        def _on_refresh_tick(self) -> None:
+            # Let a slow scan finish; forced refreshes (actions, resume) still
+            # supersede it through the exclusive worker group.
             if self.refresh_in_flight:
                 return
+            # An action or resume refreshed moments ago; this tick would redo it.
+            if not self.fs_dirty and time.monotonic() - self.last_refresh_mono < refresh_seconds * 0.5:
+                return
+            if self.fs_observer is not None:
+                self.idle_ticks += 1
+                if not self.fs_dirty and self.idle_ticks < forced_refresh_ticks:
+                    return
+            # Clear before refreshing so events raised meanwhile are kept.
+            # A filesystem change must bypass the fingerprint cache.
+            changed = self.fs_dirty
+            self.fs_dirty = False
+            self.idle_ticks = 0
+            self._start_refresh(force=changed)
+
+        def _build_payload(self, force: bool = False) -> tuple[dict[str, Any], bytes]:
+            payload = _status_payload_cached(args, force=force)
+            if payload is self.current_payload:
+                return payload, self.last_payload_signature
+            return payload, self._payload_signature(payload)
+
+        def _start_refresh(self, force: bool = False) -> None:
+            # Runs on the event loop, as does _finish_refresh, so the in-flight
+            # flag and generation are only ever touched from one thread.
+            self.refresh_generation += 1
             self.refresh_in_flight = True
-            previous_error = self.last_error
+            self.last_refresh_mono = time.monotonic()
+            self._refresh_payload_worker(self.refresh_generation, force)
+
+        @work(thread=True, exclusive=True, group="refresh")
+        def _refresh_payload_worker(self, generation: int, force: bool = False) -> None:
+            # Collect and hash in a worker thread; only _finish_refresh, run
+            # back on the event loop, touches widgets.
             try:
-                next_payload = _status_payload(args)
-                next_signature = self._payload_signature(next_payload)
-                data_changed = next_signature != self.last_payload_signature
-                had_error = bool(previous_error)
-                self.current_payload = next_payload
-                self.last_payload_signature = next_signature
-                self.last_error = ""
-                if data_changed or had_error:
-                    self._render_payload()
+                next_payload, next_signature = self._build_payload(force)
             except SystemExit as err:
-                next_error = str(err) or "status refresh failed"
-                if next_error != self.last_error:
-                    self.last_error = next_error
-                    self._render_payload()
+                result: tuple[Any, ...] = (None, b"", str(err) or "status refresh failed")
             except Exception as err:
-                next_error = str(err)
-                if next_error != self.last_error:
-                    self.last_error = next_error
-                    self._render_payload()
-            finally:
-                self.refresh_in_flight = False
+                result = (None, b"", str(err))
+            else:
+                result = (next_payload, next_signature, "")
+            # A newer refresh (exclusive=True) superseded this one and owns the flag.
+            if get_current_worker().is_cancelled:
+                return
+            self.call_from_thread(self._finish_refresh, generation, result)
+
+        def _finish_refresh(self, generation: int, result: tuple[Any, ...]) -> None:
+            if generation != self.refresh_generation:
+                return
+            self.refresh_in_flight = False
+            next_payload, next_signature, error = result
+            if error:
+                self._apply_refresh_error(error)
+            else:
+                self._apply_payload(next_payload, next_signature)
+
+        def _apply_payload(self, next_payload: dict[str, Any], next_signature: bytes) -> None:
+            data_changed = next_signature != self.last_payload_signature
+            had_error = bool(self.last_error)
+            self.current_payload = next_payload
+            self.last_payload_signature = next_signature
+            self.last_error = ""
+            if data_changed or had_error:
+                self._schedule_render()
+
+        def _apply_refresh_error(self, next_error: str) -> None:
+            if next_error != self.last_error:
+                self.last_error = next_error
+                self._schedule_render()
 
         def _selected_task_id(self) -> str:
-            task_table = self.query_one("#task_table", DataTable)
+            task_table = self.task_table
             if not task_table.is_valid_row_index(task_table.cursor_row):
                 return ""
             try:
@@ -1942,7 +2718,7 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             return task_id
 
         def _selected_agent_worker(self) -> dict[str, Any] | None:
-            agents_table = self.query_one("#agents_table", DataTable)
+            agents_table = self.agents_table
             if not agents_table.is_valid_row_index(agents_table.cursor_row):
                 return None
             try:
@@ -1970,7 +2746,7 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             repo_root_raw = str(self.current_payload.get("repo_root", "")).strip()
             if not repo_root_raw:
                 self.last_error = "cannot resolve repo root for task spec viewer"
-                self._render_payload()
+                self._schedule_render()
                 return
             repo_root = Path(repo_root_raw)
 
@@ -2025,31 +2801,34 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
         def on_mount(self) -> None:
             self.title = "codex-tasks status"
             self.sub_title = "Press q to quit | Panel: Task (1=Task, 2=Log)"
-            meta = self.query_one("#meta", Horizontal)
+            meta = self.meta_box = self.query_one("#meta", Horizontal)
             meta.border_title = "Overview"
             meta.border_subtitle = "Auto-refresh"
+            self.meta_left = self.query_one("#meta_left", Static)
+            self.meta_right = self.query_one("#meta_right", Static)
+            self.bottom_tabs = self.query_one("#bottom_tabs", TabbedContent)
 
-            ready_table = self.query_one("#ready_table", DataTable)
+            ready_table = self.ready_table = self.query_one("#ready_table", DataTable)
             ready_table.border_title = "Ready Tasks"
             ready_table.border_subtitle = "dependency-cleared queue"
             ready_table.zebra_stripes = True
             ready_table.cursor_type = "row"
             ready_table.add_columns("Task", "Owner", "Scope", "Deps")
 
-            agents_table = self.query_one("#agents_table", DataTable)
+            agents_table = self.agents_table = self.query_one("#agents_table", DataTable)
             agents_table.border_title = "Running Agents"
             agents_table.border_subtitle = "active worker processes"
             agents_table.zebra_stripes = True
             agents_table.cursor_type = "row"
             agents_table.add_columns("Agent", "Task", "State", "PID")
 
-            task_table = self.query_one("#task_table", DataTable)
+            task_table = self.task_table = self.query_one("#task_table", DataTable)
             task_table.zebra_stripes = True
             task_table.cursor_type = "row"
             task_table.add_columns(
                 "Task", "Title", "Owner", "Scope", "Status", "Spec", "Deps")
 
-            log_table = self.query_one("#log_table", DataTable)
+            log_table = self.log_table = self.query_one("#log_table", DataTable)
             log_table.zebra_stripes = True
             log_table.cursor_type = "row"
             log_table.add_columns("Timestamp (UTC)", "Agent",
@@ -2058,82 +2837,91 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
             self.last_payload_signature = self._payload_signature(
                 self.current_payload)
             self._render_payload()
-            self.set_interval(refresh_seconds, self._refresh_payload)
+            self._start_fs_watch()
+            self.refresh_timer = self.set_interval(refresh_seconds, self._on_refresh_tick)
+            # No polling while the app is suspended (e.g. Ctrl+Z to the shell).
+            self.app_suspend_signal.subscribe(self, self._on_app_suspend)
+            self.app_resume_signal.subscribe(self, self._on_app_resume)
+
+        def on_unmount(self) -> None:
+            self._stop_fs_watch()
+
+        def _on_app_suspend(self, *_: Any) -> None:
+            if self.refresh_timer is not None:
+                self.refresh_timer.pause()
+
+        def _on_app_resume(self, *_: Any) -> None:
+            if self.refresh_timer is not None:
+                self.refresh_timer.resume()
+            self.fs_dirty = True
+            self._start_refresh(force=True)
 
         def action_show_tasks(self) -> None:
-            tabs = self.query_one("#bottom_tabs", TabbedContent)
+            tabs = self.bottom_tabs
             tabs.active = "tasks_tab"
             self.active_bottom_tab = "tasks_tab"
-            self._render_payload()
+            self._schedule_render()
 
         def action_show_logs(self) -> None:
-            tabs = self.query_one("#bottom_tabs", TabbedContent)
+            tabs = self.bottom_tabs
             tabs.active = "log_tab"
             self.active_bottom_tab = "log_tab"
-            self._render_payload()
+            self._schedule_render()
 
         def action_emergency_stop(self) -> None:
             def on_close(confirmed: bool | None) -> None:
                 if confirmed:
-                    self._run_emergency_stop()
+                    self.run_worker(self._run_emergency_stop(), group="actions")
                 else:
                     self.last_action = "Stop-All canceled"
-                    self._render_payload()
+                    self._schedule_render()
 
             self.push_screen(
-                ActionConfirmModal(
-                    "This action will run:\n\n"
-                    "codex-tasks task stop --all --apply\n\n"
-                    "Are you sure you want to proceed?",
-                    "Yes (Y)",
-                    variant="error",
-                ),
+                ActionConfirmModal(*self.STOP_CONFIRM, variant="error"),
                 on_close,
             )
 
         def action_run_start(self) -> None:
             def on_close(confirmed: bool | None) -> None:
                 if confirmed:
-                    self._run_start()
+                    self.run_worker(self._run_start(), group="actions")
                 else:
                     self.last_action = "Start canceled"
-                    self._render_payload()
+                    self._schedule_render()
 
             self.push_screen(
-                ActionConfirmModal(
-                    "This action will run:\n\n"
-                    "codex-tasks run start\n\n"
-                    "Are you sure you want to proceed?",
-                    "Yes (Y)",
-                    variant="primary",
-                ),
+                ActionConfirmModal(*self.START_CONFIRM, variant="primary"),
                 on_close
             )
 
         def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
-            if event.tabbed_content.id != "bottom_tabs":
+            # Identity against the handles cached in on_mount; no id lookups.
+            if event.tabbed_content is not self.bottom_tabs:
+                return
+            pane_id = event.pane.id or ""
+            # action_show_tasks/action_show_logs already switched and rendered.
+            if pane_id == self.active_bottom_tab:
                 return
-            pane_id = str(getattr(event.pane, "id", "") or "")
             if pane_id in {"tasks_tab", "log_tab"}:
                 self.active_bottom_tab = pane_id
-                self._render_payload()
+                self._schedule_render()
 
         def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
-            table_id = getattr(event.data_table, "id", "")
-            if table_id == "task_table":
+            table = event.data_table
+            if table is self.task_table:
                 task_id = self._selected_task_id()
                 if not task_id:
                     return
                 self._open_task_spec(task_id)
                 return
-            if table_id == "agents_table":
+            if table is self.agents_table:
                 worker = self._selected_agent_worker()
                 if worker is None:
                     return
                 self._open_agent_session(worker)
 
         def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
-            if getattr(event.data_table, "id", "") != "agents_table":
+            if event.data_table is not self.agents_table:
                 return
             worker = self._selected_agent_worker()
             if worker is None:
@@ -2143,150 +2931,161 @@ def _run_status_tui(args: argparse.Namespace, initial_payload: dict[str, Any]) -
     StatusTui().run()
 
 
+@lru_cache(maxsize=1)
+def _is_interactive() -> bool:
+    # stdout first: piped output never needs the stdin check.
+    return os.isatty(1) and os.isatty(0)
+
+
 def cmd_status(args: argparse.Namespace) -> None:
+    opts = _ready_args(args)
     if args.format == "tui":
         # In non-interactive shells (tests/CI), keep deterministic text output.
-        if not (sys.stdin.isatty() and sys.stdout.isatty()):
-            payload = _status_payload(args)
+        if not _is_interactive():
+            payload = _build_status_payload(opts)
             print(_render_status_text(payload))
             return
-        _run_status_tui(args, _status_payload(args))
+        # Seed through the fingerprint cache so the first refresh can reuse it.
+        _run_status_tui(opts, _status_payload_cached(opts))
         return
 
-    payload = _status_payload(args)
+    payload = _build_status_payload(opts)
     if args.format == "json":
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        _write_json(payload)
+        return
+    if args.format == "msgpack":
+        _write_msgpack(payload)
         return
 
     print(_render_status_text(payload))
 
 
-def cmd_select_stop(args: argparse.Namespace) -> None:
-    payload = _inventory_payload(args)
-    workers = payload["workers"]
+def _write_select_tsv(rows: list[dict[str, Any]]) -> None:
+    _write_tsv_lines(map(_worker_tsv_line, rows))
 
-    selected: list[dict[str, Any]] = []
-    if args.task:
-        selected = [w for w in workers if w["task_id"] == args.task]
-    elif args.owner:
-        want = owner_key(args.owner)
-        selected = [w for w in workers if owner_key(w["owner"]) == want]
-    elif args.all:
-        selected = workers
 
+def _build_workers_payload(args: ReadyArgs, keep: Any = None) -> dict[str, Any]:
+    # Already in the select output shape; the inventory summary is not needed.
+    _, ctx, _ = load_ctx(args)
+    return {
+        "workers": classify_records(
+            _cached_dir_load(load_pid_inventory, ctx["orch_dir"]),
+            _cached_dir_load(load_lock_inventory, ctx["lock_dir"]),
+            keep,
+        )
+    }
+
+
+def _write_selected(args: argparse.Namespace, payload: dict[str, Any]) -> None:
     if args.format == "tsv":
-        for row in selected:
-            print(
-                "\t".join(
-                    [
-                        row["key"],
-                        row["task_id"],
-                        row["owner"],
-                        row["scope"],
-                        row["state"],
-                        str(row["pid"] or ""),
-                        "1" if row["pid_alive"] else "0",
-                        str(row["pid_file"] or ""),
-                        str(row["lock_file"] or ""),
-                        str(row["worktree"] or ""),
-                        str(row["tmux_session"] or ""),
-                        "1" if row["worktree_exists"] else "0",
-                    ]
-                )
-            )
+        _write_select_tsv(payload["workers"])
+        return
+    if args.format == "msgpack":
+        _write_msgpack(payload)
+        return
+    if args.format == "ndjson":
+        _write_ndjson(payload["workers"])
+        return
+
+    _write_json(payload)
+
+
+def cmd_select_stop(args: argparse.Namespace) -> None:
+    if args.all:
+        _write_selected(args, _build_workers_payload(_ready_args(args)))
         return
 
-    print(json.dumps({"workers": selected}, ensure_ascii=False, indent=2))
+    # Unmatched workers are dropped before their pid/worktree probes.
+    if args.task:
+        want_task = args.task
+        payload = _build_workers_payload(_ready_args(args), lambda task_id, _owner: task_id == want_task)
+    else:
+        want = _owner_key(args.owner)
+        payload = _build_workers_payload(_ready_args(args), lambda _task_id, owner: _owner_key(owner) == want)
+    _write_selected(args, payload)
 
 
 def cmd_select_stale(args: argparse.Namespace) -> None:
-    payload = _inventory_payload(args)
-    selected = [w for w in payload["workers"] if w["stale"]]
+    workers = _build_workers_payload(_ready_args(args))["workers"]
+    _write_selected(args, {"workers": [w for w in workers if w["stale"]]})
 
-    if args.format == "tsv":
-        for row in selected:
-            print(
-                "\t".join(
-                    [
-                        row["key"],
-                        row["task_id"],
-                        row["owner"],
-                        row["scope"],
-                        row["state"],
-                        str(row["pid"] or ""),
-                        "1" if row["pid_alive"] else "0",
-                        str(row["pid_file"] or ""),
-                        str(row["lock_file"] or ""),
-                        str(row["worktree"] or ""),
-                        str(row["tmux_session"] or ""),
-                        "1" if row["worktree_exists"] else "0",
-                    ]
-                )
-            )
-        return
 
-    print(json.dumps({"workers": selected}, ensure_ascii=False, indent=2))
+def _add_common_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--repo", help="Git repository root or child path")
+    p.add_argument("--state-dir", dest="state_dir",
+                   help="State directory override")
+    p.add_argument("--config", help="Config path override")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="codex-tasks python engine")
-    sub = parser.add_subparsers(dest="cmd", required=True)
+def _add_paths_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--format", choices=["json", "env"], default="json")
+
 
-    def add_common(p: argparse.ArgumentParser) -> None:
-        p.add_argument("--repo", help="Git repository root or child path")
-        p.add_argument("--state-dir", dest="state_dir",
-                       help="State directory override")
-        p.add_argument("--config", help="Config path override")
-
-    p_paths = sub.add_parser("paths")
-    add_common(p_paths)
-    p_paths.add_argument("--format", choices=["json", "env"], default="json")
-    p_paths.set_defaults(fn=cmd_paths)
-
-    p_ready = sub.add_parser("ready")
-    add_common(p_ready)
-    p_ready.add_argument("--trigger", default="manual")
-    p_ready.add_argument("--max-start", type=int)
-    p_ready.add_argument("--format", choices=["json", "tsv"], default="json")
-    p_ready.set_defaults(fn=cmd_ready)
-
-    p_status = sub.add_parser("status")
-    add_common(p_status)
-    p_status.add_argument("--trigger", default="manual")
-    p_status.add_argument("--max-start", type=int)
-    p_status.add_argument(
-        "--format", choices=["text", "json", "tui"], default="text")
-    p_status.set_defaults(fn=cmd_status)
-
-    p_inventory = sub.add_parser("inventory")
-    add_common(p_inventory)
-    p_inventory.add_argument(
+def _add_ready_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--trigger", default="manual")
+    p.add_argument("--max-start", type=int)
+    p.add_argument("--format", choices=["json", "tsv"], default="json")
+
+
+def _add_status_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--trigger", default="manual")
+    p.add_argument("--max-start", type=int)
+    p.add_argument(
+        "--format", choices=["text", "json", "tui", "msgpack"], default="text")
+
+
+def _add_inventory_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
         "--format", choices=["json", "tsv"], default="json")
-    p_inventory.set_defaults(fn=cmd_inventory)
 
-    p_stop = sub.add_parser("select-stop")
-    add_common(p_stop)
-    p_stop.add_argument("--task")
-    p_stop.add_argument("--owner")
-    p_stop.add_argument("--all", action="store_true")
-    p_stop.add_argument("--format", choices=["json", "tsv"], default="json")
-    p_stop.set_defaults(fn=cmd_select_stop)
 
-    p_stale = sub.add_parser("select-stale")
-    add_common(p_stale)
-    p_stale.add_argument("--format", choices=["json", "tsv"], default="json")
-    p_stale.set_defaults(fn=cmd_select_stale)
+def _add_select_stop_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--task")
+    p.add_argument("--owner")
+    p.add_argument("--all", action="store_true")
+    p.add_argument("--format", choices=["json", "tsv", "msgpack", "ndjson"], default="json")
+
+
+def _add_select_stale_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--format", choices=["json", "tsv", "msgpack", "ndjson"], default="json")
+
+
+# Subcommand name -> (handler, argument builder), in help order.
+_SUBCOMMANDS: dict[str, tuple[Any, Any]] = {
+    "paths": (cmd_paths, _add_paths_args),
+    "ready": (cmd_ready, _add_ready_args),
+    "status": (cmd_status, _add_status_args),
+    "inventory": (cmd_inventory, _add_inventory_args),
+    "select-stop": (cmd_select_stop, _add_select_stop_args),
+    "select-stale": (cmd_select_stale, _add_select_stale_args),
+}
+
+
+def build_parser(only: str | None = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="codex-tasks python engine")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    for name, (fn, add_args) in _SUBCOMMANDS.items():
+        # Every call runs one subcommand; skip building the others when known.
+        if only is not None and name != only:
+            continue
+        p = sub.add_parser(name)
+        _add_common_args(p)
+        add_args(p)
+        p.set_defaults(fn=fn)
 
     return parser
 
 
 def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    only = argv[0] if argv and argv[0] in _SUBCOMMANDS else None
+    parser = build_parser(only)
+    args = parser.parse_args(argv)
 
     if getattr(args, "cmd", "") == "select-stop":
-        selected = [bool(args.task), bool(args.owner), bool(args.all)]
-        if sum(selected) != 1:
+        flags = (1 if args.task else 0) | (2 if args.owner else 0) | (4 if args.all else 0)
+        if flags not in (1, 2, 4):
             die("select-stop requires exactly one of --task, --owner, --all")
 
     try:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 
 ACTIVE_STATES = {"RUNNING", "LOCKED", "FINALIZING"}
@@ -56,8 +57,9 @@ def load_pid_inventory(orch_dir: str | Path) -> list[dict[str, Any]]:
         if not pid_meta.is_file():
             continue
         task_id = read_field(pid_meta, "task_id")
-        owner = read_field(pid_meta, "owner")
-        scope = read_field(pid_meta, "scope")
+        # Few distinct owners/scopes repeat across many rows; share one object.
+        owner = sys.intern(read_field(pid_meta, "owner"))
+        scope = sys.intern(read_field(pid_meta, "scope"))
         pid = read_field(pid_meta, "pid")
         worktree = read_field(pid_meta, "worktree")
         tmux_session = read_field(pid_meta, "tmux_session")
@@ -90,8 +92,8 @@ def load_lock_inventory(lock_dir: str | Path) -> list[dict[str, Any]]:
 
     for lock_meta in sorted(base.glob("*.lock")):
         task_id = read_field(lock_meta, "task_id")
-        owner = read_field(lock_meta, "owner")
-        scope = read_field(lock_meta, "scope")
+        owner = sys.intern(read_field(lock_meta, "owner"))
+        scope = sys.intern(read_field(lock_meta, "scope"))
         worktree = read_field(lock_meta, "worktree")
 
         key = task_id if task_id else f"LOCKONLY:{scope}:{owner}:{lock_meta.name}"
@@ -108,7 +110,11 @@ def load_lock_inventory(lock_dir: str | Path) -> list[dict[str, Any]]:
     return rows
 
 
-def classify_records(pid_rows: list[dict[str, Any]], lock_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def iter_classified_records(
+    pid_rows: list[dict[str, Any]],
+    lock_rows: list[dict[str, Any]],
+    keep: Callable[[str, str], bool] | None = None,
+) -> Iterator[dict[str, Any]]:
     by_key: dict[str, dict[str, Any]] = {}
 
     for row in pid_rows:
@@ -116,8 +122,6 @@ def classify_records(pid_rows: list[dict[str, Any]], lock_rows: list[dict[str, A
     for row in lock_rows:
         by_key.setdefault(row["key"], {})["lock"] = row
 
-    records: list[dict[str, Any]] = []
-
     for key in sorted(by_key.keys()):
         combined = by_key[key]
         pid_row = combined.get("pid", {})
@@ -126,6 +130,9 @@ def classify_records(pid_rows: list[dict[str, Any]], lock_rows: list[dict[str, A
         task_id = pid_row.get("task_id") or lock_row.get("task_id") or key
         owner = pid_row.get("owner") or lock_row.get("owner") or ""
         scope = pid_row.get("scope") or lock_row.get("scope") or ""
+        # Filter on (task_id, owner) before the liveness and worktree probes.
+        if keep is not None and not keep(task_id, owner):
+            continue
         worktree = pid_row.get("worktree") or lock_row.get("worktree") or ""
 
         pid = pid_row.get("pid", "")
@@ -160,27 +167,31 @@ def classify_records(pid_rows: list[dict[str, Any]], lock_rows: list[dict[str, A
 
         stale = is_stale_state(state)
 
-        records.append(
-            {
-                "key": key,
-                "task_id": task_id,
-                "owner": owner,
-                "scope": scope,
-                "state": state,
-                "pid": int(pid) if pid.isdigit() else None,
-                "pid_alive": pid_alive,
-                "pid_file": pid_file or None,
-                "lock_file": lock_file or None,
-                "worktree": worktree or None,
-                "tmux_session": tmux_session or None,
-                "launch_backend": launch_backend or None,
-                "log_file": log_file or None,
-                "worktree_exists": worktree_exists,
-                "stale": stale,
-            }
-        )
-
-    return records
+        yield {
+            "key": key,
+            "task_id": task_id,
+            "owner": owner,
+            "scope": scope,
+            "state": state,
+            "pid": int(pid) if pid.isdigit() else None,
+            "pid_alive": pid_alive,
+            "pid_file": pid_file or None,
+            "lock_file": lock_file or None,
+            "worktree": worktree or None,
+            "tmux_session": tmux_session or None,
+            "launch_backend": launch_backend or None,
+            "log_file": log_file or None,
+            "worktree_exists": worktree_exists,
+            "stale": stale,
+        }
+
+
+def classify_records(
+    pid_rows: list[dict[str, Any]],
+    lock_rows: list[dict[str, Any]],
+    keep: Callable[[str, str], bool] | None = None,
+) -> list[dict[str, Any]]:
+    return list(iter_classified_records(pid_rows, lock_rows, keep))
 
 
 def summarize(records: list[dict[str, Any]]) -> dict[str, Any]:
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+_GATE_DEP_RE = re.compile(r"G\d+")
+_TASK_DEP_RE = re.compile(r"T\d+-\d+")
+
+
 class TodoError(RuntimeError):
     pass
 
@@ -70,9 +76,10 @@ def parse_todo(todo_file: str | Path, schema: dict[str, Any]) -> tuple[list[dict
 
         task_id = _field(cols, id_col)
         title = _field(cols, title_col)
-        owner = _field(cols, owner_col)
+        # Owners and statuses come from a small set; intern them once per parse.
+        owner = sys.intern(_field(cols, owner_col))
         deps = _field(cols, deps_col)
-        status = _field(cols, status_col)
+        status = sys.intern(_field(cols, status_col))
 
         if not task_id or task_id == "ID" or set(task_id) == {"-"}:
             continue
@@ -110,23 +117,52 @@ def build_indexes(tasks: list[dict[str, str]]) -> dict[str, str]:
     return {task["id"]: task["status"] for task in tasks}
 
 
-def deps_ready(deps: str, task_status: dict[str, str], gate_status: dict[str, str]) -> bool:
+@lru_cache(maxsize=1024)
+def split_deps(deps: str) -> tuple[frozenset[str], frozenset[str]] | None:
+    # (gate ids, task ids) a deps cell waits on, or None when it names
+    # something that is neither, which can never become ready.
     raw = (deps or "").strip()
     if not raw or raw == "-":
-        return True
+        return frozenset(), frozenset()
 
+    gate_deps: set[str] = set()
+    task_deps: set[str] = set()
     for dep_raw in raw.split(","):
         dep = dep_raw.strip()
         if not dep:
             continue
-
-        if re.fullmatch(r"G\d+", dep):
-            if gate_status.get(dep, "") != "DONE":
-                return False
-        elif re.fullmatch(r"T\d+-\d+", dep):
-            if task_status.get(dep, "") != "DONE":
-                return False
+        if _GATE_DEP_RE.fullmatch(dep):
+            gate_deps.add(dep)
+        elif _TASK_DEP_RE.fullmatch(dep):
+            task_deps.add(dep)
         else:
-            return False
+            return None
+    return frozenset(gate_deps), frozenset(task_deps)
+
+
+def pending_dep_counts(tasks: list[dict[str, str]], gate_status: dict[str, str]) -> list[int]:
+    # Per task position, how many of its dependencies are not DONE yet. A deps
+    # cell naming an unknown token counts as 1, since nothing can satisfy it.
+    task_status = build_indexes(tasks)
+    pending: list[int] = []
+    for task in tasks:
+        split = split_deps(task["deps"])
+        if split is None:
+            pending.append(1)
+            continue
+        gate_deps, task_deps = split
+        pending.append(
+            sum(1 for dep in gate_deps if gate_status.get(dep, "") != "DONE")
+            + sum(1 for dep in task_deps if task_status.get(dep, "") != "DONE")
+        )
+    return pending
 
-    return True
+
+def deps_ready(deps: str, task_status: dict[str, str], gate_status: dict[str, str]) -> bool:
+    split = split_deps(deps)
+    if split is None:
+        return False
+    gate_deps, task_deps = split
+    return all(gate_status.get(dep, "") == "DONE" for dep in gate_deps) and all(
+        task_status.get(dep, "") == "DONE" for dep in task_deps
+    )
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+# Minimal TOML reader for interpreters without tomllib/tomli. config.py only
+# imports it in that case; it covers the subset the config bootstrap writes.
+
+import json
+import re
+from typing import Any
+
+_INT_RE = re.compile(r"^[+-]?\d+$")
+_LIST_TOKEN_RE = re.compile(r"""
+    "(?:[^"\\]|\\.)*(?:"|\\?\Z)   # basic string, escapes allowed
+  | '[^']*(?:'|\Z)                 # literal string
+  | [\[\],]
+""", re.VERBOSE | re.DOTALL)
+
+
+class TomlDecodeError(ValueError):
+    pass
+
+
+def _strip_toml_comment(line: str) -> str:
+    if "#" not in line:
+        return line
+
+    # Jump between quote and comment characters with str.find instead of
+    # walking the line one character at a time.
+    pos = 0
+    while True:
+        hash_idx = line.find("#", pos)
+        if hash_idx < 0:
+            return line
+
+        double_idx = line.find('"', pos, hash_idx)
+        single_idx = line.find("'", pos, hash_idx)
+        if double_idx < 0 and single_idx < 0:
+            return line[:hash_idx]
+
+        if single_idx < 0 or 0 <= double_idx < single_idx:
+            close = line.find('"', double_idx + 1)
+            while close >= 0:
+                backslashes = 0
+                probe = close - 1
+                while probe > double_idx and line[probe] == "\\":
+                    backslashes += 1
+                    probe -= 1
+                if backslashes % 2 == 0:
+                    break
+                close = line.find('"', close + 1)
+        else:
+            close = line.find("'", single_idx + 1)
+
+        if close < 0:
+            # Unterminated string: the rest of the line is string content.
+            return line
+        pos = close + 1
+
+
+def _split_toml_list_items(raw: str) -> list[str]:
+    items: list[str] = []
+    depth = 0
+    start = 0
+
+    # Quoted spans are consumed whole (an unterminated string runs to the end
+    # of the value), so only brackets and commas outside strings remain.
+    for match in _LIST_TOKEN_RE.finditer(raw):
+        token = match.group()
+        if token == "[":
+            depth += 1
+        elif token == "]":
+            depth = max(0, depth - 1)
+        elif token == "," and depth == 0:
+            items.append(raw[start:match.start()].strip())
+            start = match.end()
+
+    tail = raw[start:].strip()
+    if tail:
+        items.append(tail)
+    return items
+
+
+def _parse_toml_value(raw: str) -> Any:
+    value = raw.strip()
+    if not value:
+        raise TomlDecodeError("empty TOML value")
+
+    if value.startswith('"') and value.endswith('"'):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError as exc:
+            raise TomlDecodeError(str(exc)) from exc
+
+    if value.startswith("'") and value.endswith("'"):
+        return value[1:-1]
+
+    lowered = value.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+
+    # Only values starting with a sign or digit can be integers; skip the
+    # regex for arrays and other values.
+    first = value[0]
+    if (first in "+-" or first.isdigit()) and _INT_RE.match(value):
+        return int(value)
+
+    if value.startswith("[") and value.endswith("]"):
+        inner = value[1:-1].strip()
+        if not inner:
+            return []
+        return [_parse_toml_value(part) for part in _split_toml_list_items(inner)]
+
+    raise TomlDecodeError(f"unsupported TOML value: {value}")
+
+
+def loads(text: str) -> dict[str, Any]:
+    root: dict[str, Any] = {}
+    current: dict[str, Any] = root
+
+    # One scan of the whole document; without a "#" no line needs stripping.
+    strip_comment = _strip_toml_comment if "#" in text else None
+
+    for lineno, raw_line in enumerate(text.splitlines(), start=1):
+        line = (strip_comment(raw_line) if strip_comment else raw_line).strip()
+        if not line:
+            continue
+
+        if line.startswith("[") and line.endswith("]"):
+            section_name = line[1:-1].strip()
+            if not section_name:
+                raise TomlDecodeError(f"line {lineno}: empty section header")
+
+            current = root
+            for part in section_name.split("."):
+                key = part.strip()
+                if not key:
+                    raise TomlDecodeError(f"line {lineno}: invalid section header")
+                node = current.get(key)
+                if node is None:
+                    node = {}
+                    current[key] = node
+                if not isinstance(node, dict):
+                    raise TomlDecodeError(
+                        f"line {lineno}: section collides with non-table key '{key}'"
+                    )
+                current = node
+            continue
+
+        if "=" not in line:
+            raise TomlDecodeError(f"line {lineno}: expected key=value")
+
+        key_part, value_part = line.split("=", 1)
+        key = key_part.strip()
+        if not key:
+            raise TomlDecodeError(f"line {lineno}: missing key before '='")
+
+        current[key] = _parse_toml_value(value_part)
+
+    return root
@@ -8,7 +8,8 @@ from unittest.mock import patch
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "scripts" / "py"))
 
-from config import ConfigError, _loads_toml_fallback, load_config, resolve_context
+from config import ConfigError, clear_config_cache, load_config, resolve_context
+from toml_fallback import loads as _loads_toml_fallback
 
 
 class ConfigTests(unittest.TestCase):
@@ -59,6 +60,50 @@ done_keywords = ["DONE", "완료", "complete"] # inline comment
             self.assertIn("[repo]", config_path.read_text(encoding="utf-8"))
             self.assertEqual(config["repo"]["worktree_parent"], "../sample-repo-worktrees")
             self.assertEqual(config["runtime"]["launch_backend"], "tmux")
+            self.assertNotIn("_config_repo_root", config)
+
+    def test_load_config_reuses_cached_result_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "cache-repo"
+            repo_root.mkdir(parents=True, exist_ok=True)
+
+            first, config_path = load_config(repo_root)
+            second, _ = load_config(repo_root)
+            self.assertIs(first, second)
+            with self.assertRaises(TypeError):
+                first["runtime"]["max_start"] = 9  # type: ignore[index]
+
+            config_path.write_text('[owners]\nAgentZ = "extra-scope"\n', encoding="utf-8")
+            third, _ = load_config(repo_root)
+            self.assertIsNot(first, third)
+            self.assertEqual(third["owners"]["AgentZ"], "extra-scope")
+
+            clear_config_cache()
+            fourth, _ = load_config(repo_root)
+            self.assertIsNot(third, fourth)
+            self.assertEqual(third, fourth)
+
+    def test_load_config_prefers_json_config_when_present(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "json-repo"
+            state_dir = repo_root / ".state"
+            state_dir.mkdir(parents=True, exist_ok=True)
+            (state_dir / "orchestrator.json").write_text(
+                '{"owners": {"AgentA": "json-scope"}, "runtime": {"launch_backend": "codex_exec"}}',
+                encoding="utf-8",
+            )
+
+            config, config_path = load_config(repo_root)
+
+            self.assertEqual(config_path.name, "orchestrator.json")
+            self.assertFalse((state_dir / "orchestrator.toml").exists())
+            self.assertEqual(config["owners"]["AgentA"], "json-scope")
+            self.assertEqual(config["runtime"]["launch_backend"], "codex_exec")
+            self.assertEqual(config["todo"]["status_col"], 7)
+
+            (state_dir / "orchestrator.json").write_text("{", encoding="utf-8")
+            with self.assertRaises(ConfigError):
+                load_config(repo_root)
 
     def test_resolve_context_state_dir_priority(self) -> None:
         with tempfile.TemporaryDirectory() as td:
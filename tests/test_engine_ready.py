@@ -242,6 +242,147 @@ class EngineReadyTests(unittest.TestCase):
             self.assertIn("Runtime: total=0 active=0 stale=0", proc.stdout)
             self.assertIn("Coordination: locks=0", proc.stdout)
 
+    def test_select_stale_msgpack_format(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "repo"
+            repo_root.mkdir(parents=True, exist_ok=True)
+            _init_git_repo(repo_root)
+
+            proc = subprocess.run(
+                [sys.executable, str(ENGINE), "select-stale", "--format", "msgpack", "--repo", str(repo_root)],
+                capture_output=True,
+            )
+
+            try:
+                import msgpack
+            except ModuleNotFoundError:
+                self.assertNotEqual(proc.returncode, 0)
+                self.assertIn(b"requires the msgpack package", proc.stderr)
+                return
+            self.assertEqual(proc.returncode, 0)
+            self.assertEqual(msgpack.unpackb(proc.stdout), {"workers": []})
+
+    def test_select_stop_ndjson_emits_one_worker_per_line(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "repo"
+            repo_root.mkdir(parents=True, exist_ok=True)
+            _init_git_repo(repo_root)
+            state_dir = repo_root / ".state"
+            worktree = Path(td) / "wt"
+            worktree.mkdir(parents=True, exist_ok=True)
+            _write_lock(state_dir, "a.lock", "AgentA", "app-shell", "T1-001", worktree)
+            _write_lock(state_dir, "b.lock", "AgentB", "domain-core", "T1-002", worktree)
+
+            proc = _run_engine_raw(repo_root, "select-stop", "--all", "--format", "ndjson")
+
+            rows = [json.loads(line) for line in proc.stdout.splitlines()]
+            self.assertEqual([row["task_id"] for row in rows], ["T1-001", "T1-002"])
+            self.assertEqual(rows[0]["state"], "LOCKED")
+
+    def test_status_payload_cached_rebuilds_only_when_fingerprint_moves(self) -> None:
+        sys.path.insert(0, str(ENGINE.parent))
+        import argparse
+
+        import engine
+
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "repo"
+            repo_root.mkdir(parents=True, exist_ok=True)
+            _init_git_repo(repo_root)
+            _write_todo(repo_root, [("T5-001", "ready", "AgentA", "-", "", "TODO")])
+            _write_specs(repo_root, ["T5-001"])
+            args = engine._ready_args(
+                argparse.Namespace(repo=str(repo_root), state_dir=None, config=None, trigger="manual", max_start=None)
+            )
+            self.assertIs(engine._ready_args(args), args)
+
+            first = engine._status_payload_cached(args)
+            self.assertIs(engine._status_payload_cached(args), first)
+
+            _write_todo(repo_root, [("T5-001", "shipped", "AgentA", "-", "", "DONE")])
+            second = engine._status_payload_cached(args)
+            self.assertIsNot(second, first)
+            self.assertEqual(second["task_board"]["tasks"][0]["status"], "DONE")
+            self.assertIsNot(engine._status_payload_cached(args, force=True), second)
+
+    def test_status_payload_cached_sees_in_place_lock_rewrite(self) -> None:
+        sys.path.insert(0, str(ENGINE.parent))
+        import argparse
+
+        import engine
+
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "repo"
+            repo_root.mkdir(parents=True, exist_ok=True)
+            _init_git_repo(repo_root)
+            _write_todo(repo_root, [("T8-001", "ready", "AgentA", "-", "", "TODO")])
+            _write_specs(repo_root, ["T8-001"])
+            state_dir = repo_root / ".state"
+            _write_lock(state_dir, "app-shell.lock", "AgentA", "app-shell", "T8-001", repo_root)
+            args = engine._ready_args(
+                argparse.Namespace(repo=str(repo_root), state_dir=None, config=None, trigger="manual", max_start=None)
+            )
+
+            first = engine._status_payload_cached(args)
+            lock_dir = state_dir / "locks"
+            dir_stat = lock_dir.stat()
+            _write_lock(state_dir, "app-shell.lock", "AgentA", "app-shell", "T8-001-rewritten", repo_root)
+            os.utime(lock_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+            second = engine._status_payload_cached(args)
+            self.assertIsNot(second, first)
+            self.assertEqual(
+                [lock["task_id"] for lock in second["coordination"]["active_locks"]], ["T8-001-rewritten"]
+            )
+
+    def test_json_bytes_match_orjson_layout(self) -> None:
+        sys.path.insert(0, str(ENGINE.parent))
+        import engine
+
+        self.assertEqual(engine._json_bytes({"a": [1, "é"], "b": {}}), '{"a":[1,"é"],"b":{}}'.encode("utf-8"))
+        self.assertEqual(engine._json_bytes({"a": [1]}, indent=True), b'{\n  "a": [\n    1\n  ]\n}')
+        self.assertEqual(engine._json_dumps({"AgentA": "app-shell"}), '{"AgentA":"app-shell"}')
+        # Non-UTF-8 file names decode to surrogate escapes; they round-trip.
+        self.assertEqual(engine._json_bytes({"p": "/tmp/\udcff"}), b'{"p":"/tmp/\xff"}')
+
+    def test_paths_resolves_repo_root_from_nested_child(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo_root = Path(td) / "repo"
+            nested = repo_root / "src" / "pkg"
+            nested.mkdir(parents=True, exist_ok=True)
+            _init_git_repo(repo_root)
+
+            payload = _run_engine(nested, "paths")
+            self.assertEqual(payload["repo_root"], str(repo_root.resolve()))
+
+            not_repo = Path(td) / "plain"
+            not_repo.mkdir()
+            proc = subprocess.run(
+                [sys.executable, str(ENGINE), "paths", "--repo", str(not_repo)],
+                capture_output=True,
+                text=True,
+            )
+            self.assertNotEqual(proc.returncode, 0)
+            self.assertIn("--repo is not a git repository", proc.stderr)
+
+    def test_cached_dir_load_tracks_in_place_rewrites(self) -> None:
+        sys.path.insert(0, str(ENGINE.parent))
+        import engine
+        from state_model import load_lock_inventory
+
+        with tempfile.TemporaryDirectory() as td:
+            state_dir = Path(td) / ".state"
+            lock_dir = state_dir / "locks"
+            _write_lock(state_dir, "app-shell.lock", "AgentA", "app-shell", "T7-001", Path(td))
+
+            first = engine._cached_dir_load(load_lock_inventory, str(lock_dir))
+            self.assertIs(engine._cached_dir_load(load_lock_inventory, str(lock_dir)), first)
+
+            _write_lock(state_dir, "app-shell.lock", "AgentA", "app-shell", "T7-002-long", Path(td))
+            second = engine._cached_dir_load(load_lock_inventory, str(lock_dir))
+            self.assertIsNot(second, first)
+            self.assertEqual(second[0]["task_id"], "T7-002-long")
+
     def test_status_payload_exposes_worker_backend_metadata(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             repo_root = Path(td) / "repo"
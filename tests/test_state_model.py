@@ -212,6 +212,12 @@ worktree=/tmp/wt
             self.assertEqual(summary["state_counts"]["RUNNING"], 1)
             self.assertEqual(summary["state_counts"]["LOCK_STALE"], 1)
 
+            probed: list[str] = []
+            with patch.object(state_model, "is_pid_alive", side_effect=lambda pid: probed.append(pid) or True):
+                kept = state_model.classify_records(pid_rows, lock_rows, lambda task_id, owner: owner == "AgentA")
+            self.assertEqual([row["task_id"] for row in kept], ["T1-001", "T7-001"])
+            self.assertEqual(probed, ["101", "701"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "scripts" / "py"))
 
-from todo_parser import TodoError, build_indexes, deps_ready, parse_todo
+from todo_parser import TodoError, build_indexes, deps_ready, parse_todo, pending_dep_counts
 
 
 SCHEMA = {
@@ -53,6 +53,8 @@ Gate state: `G2 (PENDING)`
             self.assertFalse(deps_ready("UNKNOWN", task_status, gates))
             self.assertTrue(deps_ready("-", task_status, gates))
 
+            self.assertEqual(pending_dep_counts(tasks, gates), [0, 0, 1])
+
     def test_missing_todo_file_raises(self) -> None:
         with tempfile.TemporaryDirectory() as td:
             missing = Path(td) / "TODO.md"